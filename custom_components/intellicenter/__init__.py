@@ -13,7 +13,7 @@ import re
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, Platform, UnitOfTemperature
+from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
@@ -152,6 +152,9 @@ class PoolEntity(CoordinatorEntity[IntelliCenterCoordinator], Entity):
     including device info, state attributes, and update callbacks.
     """
 
+    # Home Assistant's base classes keep a __dict__; slot only our own state
+    __slots__ = ("_attribute_key", "_custom_name", "_extra_state_attrs", "_pool_object")
+
     _attr_has_entity_name = True
     _attr_should_poll = False
 
@@ -183,8 +186,10 @@ class PoolEntity(CoordinatorEntity[IntelliCenterCoordinator], Entity):
         self._pool_object = pool_object
         self._attribute_key = attribute_key
         self._custom_name = name
-        self._extra_state_attrs: set[str] = (
-            set(extra_state_attributes) if extra_state_attributes else set()
+        self._extra_state_attrs: tuple[str, ...] = (
+            tuple(dict.fromkeys(extra_state_attributes))
+            if extra_state_attributes
+            else ()
         )
 
         self._attr_entity_registry_enabled_default = enabled_by_default
@@ -243,11 +248,14 @@ class PoolEntity(CoordinatorEntity[IntelliCenterCoordinator], Entity):
         obj_subtype = self._pool_object.subtype
 
         # Count how many objects of the same type/subtype exist
-        count = sum(
-            1
-            for obj in self.coordinator.model
-            if obj.objtype == obj_type and obj.subtype == obj_subtype
-        )
+        if obj_subtype:
+            count = len(self.coordinator.objects_of_type(obj_type, obj_subtype))
+        else:
+            count = sum(
+                1
+                for obj in self.coordinator.objects_of_type(obj_type)
+                if obj.subtype == obj_subtype
+            )
 
         # Only strip " 1" if there's exactly one instance
         if count == 1:
@@ -339,6 +347,20 @@ class PoolEntity(CoordinatorEntity[IntelliCenterCoordinator], Entity):
         """Return true if the entity is updated by the updates from IntelliCenter."""
         return self._attribute_key in updates.get(self._pool_object.objnam, {})
 
+    def _listened_objnams(self) -> Iterable[str]:
+        """Return the names of the pool objects whose updates affect this entity."""
+        return (self._pool_object.objnam,)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to push updates for the pool objects this entity uses."""
+        # The coordinator-wide listener still delivers connection state changes
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_object_listener(
+                self._listened_objnams(), self._handle_coordinator_update
+            )
+        )
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -353,11 +375,20 @@ class PoolEntity(CoordinatorEntity[IntelliCenterCoordinator], Entity):
             # Clear optimistic state if this entity uses OnOffControlMixin
             if hasattr(self, "_clear_optimistic_state"):
                 self._clear_optimistic_state()
-            self.async_write_ha_state()
+            if self._should_write_state():
+                self.async_write_ha_state()
         elif not updates:
             # Connection state change - update availability
             self.async_write_ha_state()
 
+    def _should_write_state(self) -> bool:
+        """Return true if an update to this entity's object changes its state.
+
+        Called once the pool object has been refreshed; subclasses can override
+        it to drop updates that leave the reported state as it was.
+        """
+        return True
+
     def pentairTemperatureSettings(self) -> str:
         """Return the native temperature unit from the Pentair system.
 
@@ -365,15 +396,10 @@ class PoolEntity(CoordinatorEntity[IntelliCenterCoordinator], Entity):
         are expressed in. Home Assistant will automatically convert the display
         to match the user's unit system preference (Settings > System > General).
         """
-        system_info = self.coordinator.system_info
-        if system_info is None:
-            return str(UnitOfTemperature.FAHRENHEIT)
-
-        if system_info.uses_metric:
-            return str(UnitOfTemperature.CELSIUS)
-        return str(UnitOfTemperature.FAHRENHEIT)
+        return self.coordinator.temperature_unit
 
-    def _safe_float_conversion(self, value: Any) -> float | None:
+    @staticmethod
+    def _safe_float_conversion(value: Any) -> float | None:
         """Safely convert a value to float."""
         if value is None:
             return None
@@ -382,7 +408,8 @@ class PoolEntity(CoordinatorEntity[IntelliCenterCoordinator], Entity):
         except (ValueError, TypeError):
             return None
 
-    def _safe_int_conversion(self, value: Any) -> int | None:
+    @staticmethod
+    def _safe_int_conversion(value: Any) -> int | None:
         """Safely convert a value to int."""
         if value is None:
             return None
@@ -10,6 +10,7 @@ This module provides binary sensor entities for:
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 import logging
 from typing import Any
 
@@ -47,6 +48,9 @@ _LOGGER = logging.getLogger(__name__)
 # Coordinator handles updates via push, so no parallel update limit needed
 PARALLEL_UPDATES = 0
 
+# Body attributes that affect whether a heater is heating
+_HEATING_BODY_ATTRS = frozenset({STATUS_ATTR, HEATER_ATTR, HTMODE_ATTR})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -59,90 +63,93 @@ async def async_setup_entry(
     sensors: list[PoolBinarySensor | HeaterBinarySensor | ScheduleBinarySensor] = []
 
     obj: PoolObject
-    for obj in coordinator.model:
-        if obj.objtype == CIRCUIT_TYPE and obj.subtype == "FRZ":
+    for obj in coordinator.objects_of_type(CIRCUIT_TYPE, "FRZ"):
+        sensors.append(
+            PoolBinarySensor(
+                coordinator,
+                obj,
+                icon="mdi:snowflake",
+                device_class=BinarySensorDeviceClass.COLD,
+                entity_category=EntityCategory.DIAGNOSTIC,
+            )
+        )
+
+    for obj in coordinator.objects_of_type(HEATER_TYPE):
+        sensors.append(
+            HeaterBinarySensor(
+                coordinator,
+                obj,
+            )
+        )
+
+    for obj in coordinator.objects_of_type(SCHED_TYPE):
+        sensors.append(
+            ScheduleBinarySensor(
+                coordinator,
+                obj,
+            )
+        )
+
+    for obj in coordinator.objects_of_type(PUMP_TYPE):
+        sensors.append(
+            PoolBinarySensor(
+                coordinator,
+                obj,
+                value_for_on=PUMP_STATUS_ON,
+                device_class=BinarySensorDeviceClass.RUNNING,
+            )
+        )
+
+    for obj in coordinator.objects_of_type(CHEM_TYPE, "ICHEM"):
+        # IntelliChem alarm indicators (diagnostic entities)
+        if PHHI_ATTR in obj.attribute_keys:
             sensors.append(
                 PoolBinarySensor(
                     coordinator,
                     obj,
-                    icon="mdi:snowflake",
-                    device_class=BinarySensorDeviceClass.COLD,
+                    attribute_key=PHHI_ATTR,
+                    name="+ (pH High Alarm)",
+                    icon="mdi:alert-plus-outline",
+                    device_class=BinarySensorDeviceClass.PROBLEM,
                     entity_category=EntityCategory.DIAGNOSTIC,
                 )
             )
-        elif obj.objtype == HEATER_TYPE:
+        if PHLO_ATTR in obj.attribute_keys:
             sensors.append(
-                HeaterBinarySensor(
+                PoolBinarySensor(
                     coordinator,
                     obj,
+                    attribute_key=PHLO_ATTR,
+                    name="+ (pH Low Alarm)",
+                    icon="mdi:alert-minus-outline",
+                    device_class=BinarySensorDeviceClass.PROBLEM,
+                    entity_category=EntityCategory.DIAGNOSTIC,
                 )
             )
-        elif obj.objtype == SCHED_TYPE:
+        if ORPHI_ATTR in obj.attribute_keys:
             sensors.append(
-                ScheduleBinarySensor(
+                PoolBinarySensor(
                     coordinator,
                     obj,
+                    attribute_key=ORPHI_ATTR,
+                    name="+ (ORP High Alarm)",
+                    icon="mdi:alert-plus-outline",
+                    device_class=BinarySensorDeviceClass.PROBLEM,
+                    entity_category=EntityCategory.DIAGNOSTIC,
                 )
             )
-        elif obj.objtype == PUMP_TYPE:
+        if ORPLO_ATTR in obj.attribute_keys:
             sensors.append(
                 PoolBinarySensor(
                     coordinator,
                     obj,
-                    value_for_on=PUMP_STATUS_ON,
-                    device_class=BinarySensorDeviceClass.RUNNING,
+                    attribute_key=ORPLO_ATTR,
+                    name="+ (ORP Low Alarm)",
+                    icon="mdi:alert-minus-outline",
+                    device_class=BinarySensorDeviceClass.PROBLEM,
+                    entity_category=EntityCategory.DIAGNOSTIC,
                 )
             )
-        elif obj.objtype == CHEM_TYPE and obj.subtype == "ICHEM":
-            # IntelliChem alarm indicators (diagnostic entities)
-            if PHHI_ATTR in obj.attribute_keys:
-                sensors.append(
-                    PoolBinarySensor(
-                        coordinator,
-                        obj,
-                        attribute_key=PHHI_ATTR,
-                        name="+ (pH High Alarm)",
-                        icon="mdi:alert-plus-outline",
-                        device_class=BinarySensorDeviceClass.PROBLEM,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-            if PHLO_ATTR in obj.attribute_keys:
-                sensors.append(
-                    PoolBinarySensor(
-                        coordinator,
-                        obj,
-                        attribute_key=PHLO_ATTR,
-                        name="+ (pH Low Alarm)",
-                        icon="mdi:alert-minus-outline",
-                        device_class=BinarySensorDeviceClass.PROBLEM,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-            if ORPHI_ATTR in obj.attribute_keys:
-                sensors.append(
-                    PoolBinarySensor(
-                        coordinator,
-                        obj,
-                        attribute_key=ORPHI_ATTR,
-                        name="+ (ORP High Alarm)",
-                        icon="mdi:alert-plus-outline",
-                        device_class=BinarySensorDeviceClass.PROBLEM,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-            if ORPLO_ATTR in obj.attribute_keys:
-                sensors.append(
-                    PoolBinarySensor(
-                        coordinator,
-                        obj,
-                        attribute_key=ORPLO_ATTR,
-                        name="+ (ORP Low Alarm)",
-                        icon="mdi:alert-minus-outline",
-                        device_class=BinarySensorDeviceClass.PROBLEM,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
     async_add_entities(sensors)
 
 
@@ -216,7 +223,10 @@ class HeaterBinarySensor(PoolEntity, BinarySensorEntity):
         """
         super().__init__(coordinator, pool_object, **kwargs)
         body_attr = pool_object[BODY_ATTR]
-        self._bodies: set[str] = set(body_attr.split(" ")) if body_attr else set()
+        # The served bodies are fixed at setup; checked on every push
+        self._bodies: frozenset[str] = (
+            frozenset(body_attr.split(" ")) if body_attr else frozenset()
+        )
 
     @property
     def is_on(self) -> bool:
@@ -248,7 +258,7 @@ class HeaterBinarySensor(PoolEntity, BinarySensorEntity):
         """
         # Check if any monitored body had heating-related updates
         for objnam in self._bodies & updates.keys():
-            if {STATUS_ATTR, HEATER_ATTR, HTMODE_ATTR} & updates[objnam].keys():
+            if not _HEATING_BODY_ATTRS.isdisjoint(updates[objnam]):
                 return True
 
         # Also check if the heater object itself was updated
@@ -257,6 +267,10 @@ class HeaterBinarySensor(PoolEntity, BinarySensorEntity):
 
         return False
 
+    def _listened_objnams(self) -> Iterable[str]:
+        """Return the heater and the bodies it serves."""
+        return (self._pool_object.objnam, *self._bodies)
+
 
 # -------------------------------------------------------------------------------------
 
@@ -8,11 +8,12 @@ notifications from the controller.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, UnitOfTemperature
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from pyintellicenter import (
@@ -77,6 +78,7 @@ from pyintellicenter import (
     ICModelController,
     ICSystemInfo,
     PoolModel,
+    PoolObject,
 )
 
 from .const import DEFAULT_TRANSPORT, DOMAIN, TransportType
@@ -220,6 +222,16 @@ class IntelliCenterCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]])
         self._stop_listener: CALLBACK_TYPE | None = None
         self._connected = False
 
+        # Lazily-built index of pool objects by type and (type, subtype)
+        self._objects_by_type: dict[str, tuple[PoolObject, ...]] | None = None
+        self._objects_by_subtype: dict[tuple[str, str], tuple[PoolObject, ...]] = {}
+
+        # Cached native temperature unit, reset when the system MODE changes
+        self._temperature_unit: str | None = None
+
+        # Entity update callbacks keyed by the pool objects they depend on
+        self._object_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+
     @property
     def controller(self) -> ICModelController:
         """Return the ICModelController."""
@@ -240,6 +252,92 @@ class IntelliCenterCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]])
         """Return True if connected to the IntelliCenter."""
         return self._connected
 
+    @property
+    def temperature_unit(self) -> str:
+        """Return the unit raw IntelliCenter temperatures are expressed in."""
+        if self._temperature_unit is None:
+            system_info = self.system_info
+            if system_info is None:
+                # Not connected yet; assume Fahrenheit but don't cache it
+                return str(UnitOfTemperature.FAHRENHEIT)
+            self._temperature_unit = str(
+                UnitOfTemperature.CELSIUS
+                if system_info.uses_metric
+                else UnitOfTemperature.FAHRENHEIT
+            )
+        return self._temperature_unit
+
+    def objects_of_type(
+        self, objtype: str, subtype: str | None = None
+    ) -> tuple[PoolObject, ...]:
+        """Return the pool objects of a type, optionally narrowed by subtype.
+
+        The model is indexed on first use so that platform setup only visits
+        matching objects instead of scanning the whole model once per platform.
+
+        Args:
+            objtype: The object type to look up (e.g. BODY_TYPE)
+            subtype: Optional subtype to filter on (e.g. "ICHLOR")
+
+        Returns:
+            Matching pool objects in model order.
+        """
+        if self._objects_by_type is None:
+            self._build_object_index()
+        if subtype is None:
+            return self._objects_by_type.get(objtype, ())
+        return self._objects_by_subtype.get((objtype, subtype), ())
+
+    def _build_object_index(self) -> None:
+        """Index the model's objects by type and by (type, subtype)."""
+        by_type: dict[str, list[PoolObject]] = {}
+        by_subtype: dict[tuple[str, str], list[PoolObject]] = {}
+        for pool_obj in self._model:
+            objtype = pool_obj.objtype
+            by_type.setdefault(objtype, []).append(pool_obj)
+            if pool_obj.subtype:
+                key = (objtype, pool_obj.subtype)
+                by_subtype.setdefault(key, []).append(pool_obj)
+        self._objects_by_type = {key: tuple(objs) for key, objs in by_type.items()}
+        self._objects_by_subtype = {
+            key: tuple(objs) for key, objs in by_subtype.items()
+        }
+
+    @callback
+    def _invalidate_object_index(self) -> None:
+        """Drop the object index so it is rebuilt from the current model."""
+        self._objects_by_type = None
+        self._objects_by_subtype = {}
+
+    @callback
+    def async_add_object_listener(
+        self, objnams: Iterable[str], update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for push updates that touch any of the given pool objects.
+
+        Args:
+            objnams: Names of the pool objects the listener depends on
+            update_callback: Called when an update for one of them arrives
+
+        Returns:
+            A callback that removes the listener.
+        """
+        objnams = tuple(dict.fromkeys(objnams))
+        for objnam in objnams:
+            self._object_listeners.setdefault(objnam, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the object listener."""
+            for objnam in objnams:
+                listeners = self._object_listeners.get(objnam)
+                if listeners and update_callback in listeners:
+                    listeners.remove(update_callback)
+                    if not listeners:
+                        del self._object_listeners[objnam]
+
+        return remove_listener
+
     async def async_start(self) -> None:
         """Start the connection to the IntelliCenter."""
 
@@ -255,6 +353,8 @@ class IntelliCenterCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]])
         # Start the connection
         await self._handler.start()
         self._connected = True
+        self._invalidate_object_index()
+        self._temperature_unit = None
 
     async def async_stop(self) -> None:
         """Stop the connection to the IntelliCenter."""
@@ -285,13 +385,27 @@ class IntelliCenterCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]])
         """Handle push update from IntelliCenter.
 
         This is called by the connection handler when updates are received
-        from the IntelliCenter system.
+        from the IntelliCenter system. Only the entities registered for the
+        updated objects are notified; coordinator-wide listeners are reserved
+        for connection state changes.
 
         Args:
             data: Dictionary of object updates {objnam: {attr: value}}
         """
+        if self._temperature_unit is not None:
+            for system_obj in self.objects_of_type(SYSTEM_TYPE):
+                if MODE_ATTR in data.get(system_obj.objnam, ()):
+                    # The unit preference may have changed
+                    self._temperature_unit = None
         self.data = data
-        self.async_update_listeners()
+
+        # An entity listening to several of the updated objects runs once
+        notified: set[CALLBACK_TYPE] = set()
+        for objnam in data:
+            for update_callback in tuple(self._object_listeners.get(objnam, ())):
+                if update_callback not in notified:
+                    notified.add(update_callback)
+                    update_callback()
 
     @callback
     def async_set_connection_state(self, connected: bool) -> None:
@@ -301,7 +415,13 @@ class IntelliCenterCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]])
             connected: True if connected, False if disconnected
         """
         self._connected = connected
-        # Notify all listeners of the connection state change
+        if connected:
+            # The model may have been reloaded while reconnecting
+            self._invalidate_object_index()
+            self._temperature_unit = None
+        # Notify all listeners of the connection state change; clear the last
+        # push so entities treat this as an availability change
+        self.data = {}
         self.async_update_listeners()
 
 
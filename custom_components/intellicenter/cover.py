@@ -46,11 +46,12 @@ async def async_setup_entry(
     covers: list[PoolCover] = []
 
     pool_obj: PoolObject
-    for pool_obj in coordinator.model:
-        if pool_obj.objtype == EXTINSTR_TYPE and pool_obj.subtype == "COVER":
-            covers.append(PoolCover(coordinator, pool_obj))
+    for pool_obj in coordinator.objects_of_type(EXTINSTR_TYPE, "COVER"):
+        covers.append(PoolCover(coordinator, pool_obj))
 
-    async_add_entities(covers)
+    # Most installations have no covers; skip entity registration entirely
+    if covers:
+        async_add_entities(covers)
 
 
 # -------------------------------------------------------------------------------------
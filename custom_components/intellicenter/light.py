@@ -71,7 +71,9 @@ async def async_setup_entry(
                 )
             )
 
-    async_add_entities(lights)
+    # Skip entity registration entirely when the system has no lights
+    if lights:
+        async_add_entities(lights)
 
 
 class PoolLight(PoolEntity, LightEntity):
@@ -9,7 +9,7 @@ This module provides number entities for:
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 import logging
 from typing import Any
 
@@ -48,32 +48,88 @@ _LOGGER = logging.getLogger(__name__)
 # Coordinator handles updates via push, so no parallel update limit needed
 PARALLEL_UPDATES = 0
 
-# IntelliChem setpoint ranges (per Pentair documentation)
-PH_SETPOINT_MIN = 7.0
-PH_SETPOINT_MAX = 7.6
-PH_SETPOINT_STEP = 0.1
-
-ORP_SETPOINT_MIN = 400
-ORP_SETPOINT_MAX = 800
-ORP_SETPOINT_STEP = 10
-
-# IntelliChem water chemistry configuration ranges
-ALK_MIN = 0
-ALK_MAX = 300
-ALK_STEP = 1
-
-CALC_MIN = 0
-CALC_MAX = 800
-CALC_STEP = 1
-
-CYACID_MIN = 0
-CYACID_MAX = 200
-CYACID_STEP = 1
+# Attribute key -> (min, max, step)
+_RANGES: dict[str, tuple[float, float, float]] = {
+    # IntelliChem setpoint ranges (per Pentair documentation)
+    PHSET_ATTR: (7.0, 7.6, 0.1),
+    ORPSET_ATTR: (400, 800, 10),
+    # IntelliChem water chemistry configuration ranges
+    ALK_ATTR: (0, 300, 1),
+    CALC_ATTR: (0, 800, 1),
+    CYACID_ATTR: (0, 200, 1),
+    # Temperature setpoint range (Fahrenheit)
+    HITMP_ATTR: (40, 104, 1),
+}
+
+# IntelliChem setpoint and water chemistry controls (CONFIG category); the
+# ranges come from _RANGES.
+# The ALK/CALC/CYACID values are user-entered configuration, not sensor readings.
+_ICHEM_NUMBERS: tuple[tuple[str, dict[str, Any]], ...] = (
+    (
+        PHSET_ATTR,
+        {
+            "name": "+ pH Setpoint",
+            "icon": "mdi:ph",
+            "device_class": NumberDeviceClass.PH,
+            "mode": NumberMode.BOX,
+            "entity_category": EntityCategory.CONFIG,
+        },
+    ),
+    (
+        ORPSET_ATTR,
+        {
+            "name": "+ ORP Setpoint",
+            "icon": "mdi:test-tube",
+            "unit_of_measurement": "mV",
+            "mode": NumberMode.BOX,
+            "entity_category": EntityCategory.CONFIG,
+            "integer_only": True,
+        },
+    ),
+    (
+        ALK_ATTR,
+        {
+            "name": "+ Alkalinity",
+            "icon": "mdi:flask-outline",
+            "unit_of_measurement": CONCENTRATION_PARTS_PER_MILLION,
+            "mode": NumberMode.BOX,
+            "entity_category": EntityCategory.CONFIG,
+            "integer_only": True,
+        },
+    ),
+    (
+        CALC_ATTR,
+        {
+            "name": "+ Calcium Hardness",
+            "icon": "mdi:flask-outline",
+            "unit_of_measurement": CONCENTRATION_PARTS_PER_MILLION,
+            "mode": NumberMode.BOX,
+            "entity_category": EntityCategory.CONFIG,
+            "integer_only": True,
+        },
+    ),
+    (
+        CYACID_ATTR,
+        {
+            "name": "+ Cyanuric Acid",
+            "icon": "mdi:flask-outline",
+            "unit_of_measurement": CONCENTRATION_PARTS_PER_MILLION,
+            "mode": NumberMode.BOX,
+            "entity_category": EntityCategory.CONFIG,
+            "integer_only": True,
+        },
+    ),
+)
 
-# Temperature setpoint ranges (Fahrenheit)
-TEMP_SETPOINT_MIN = 40
-TEMP_SETPOINT_MAX = 104
-TEMP_SETPOINT_STEP = 1
+# Attribute key -> (controller convenience method, value converter)
+_SETPOINT_DISPATCH: dict[str, tuple[str, Callable[[float], float | int]]] = {
+    PHSET_ATTR: ("set_ph_setpoint", float),  # pH needs float
+    ORPSET_ATTR: ("set_orp_setpoint", int),
+    PRIM_ATTR: ("set_chlorinator_output", int),
+    ALK_ATTR: ("set_alkalinity", int),
+    CALC_ATTR: ("set_calcium_hardness", int),
+    CYACID_ATTR: ("set_cyanuric_acid", int),
+}
 
 # -------------------------------------------------------------------------------------
 
@@ -85,152 +141,73 @@ async def async_setup_entry(
 ) -> None:
     """Load pool number entities based on a config entry."""
     coordinator = entry.runtime_data
+    model = coordinator.model
 
     numbers: list[PoolNumber] = []
 
     pool_obj: PoolObject
-    for pool_obj in coordinator.model:
-        if pool_obj.objtype == CHEM_TYPE:
-            if pool_obj.subtype == "ICHLOR" and PRIM_ATTR in pool_obj.attribute_keys:
-                # IntelliChlor output percentage controls (CONFIG category)
-                body_attr = pool_obj[BODY_ATTR]
-                if body_attr is None:
-                    continue
-                intellichlor_bodies = body_attr.split(" ")
-
-                # Only create number entities for bodies that are actually configured
-                for index, body_id in enumerate(intellichlor_bodies):
-                    body = coordinator.model[body_id]
-                    if body is not None:
-                        attribute_key = PRIM_ATTR if index == 0 else SEC_ATTR
-                        numbers.append(
-                            PoolNumber(
-                                coordinator,
-                                pool_obj,
-                                unit_of_measurement=PERCENTAGE,
-                                attribute_key=attribute_key,
-                                name=f"+ Output % ({body.sname})",
-                                mode=NumberMode.BOX,
-                                entity_category=EntityCategory.CONFIG,
-                                integer_only=True,
-                            )
-                        )
-
-            elif pool_obj.subtype == "ICHEM":
-                # IntelliChem pH setpoint control (CONFIG category)
-                if PHSET_ATTR in pool_obj.attribute_keys:
-                    numbers.append(
-                        PoolNumber(
-                            coordinator,
-                            pool_obj,
-                            min_value=PH_SETPOINT_MIN,
-                            max_value=PH_SETPOINT_MAX,
-                            step=PH_SETPOINT_STEP,
-                            attribute_key=PHSET_ATTR,
-                            name="+ pH Setpoint",
-                            icon="mdi:ph",
-                            device_class=NumberDeviceClass.PH,
-                            mode=NumberMode.BOX,
-                            entity_category=EntityCategory.CONFIG,
-                        )
-                    )
-
-                # IntelliChem ORP setpoint control (CONFIG category)
-                if ORPSET_ATTR in pool_obj.attribute_keys:
+    for pool_obj in coordinator.objects_of_type(CHEM_TYPE):
+        subtype = pool_obj.subtype
+        attribute_keys = pool_obj.attribute_keys
+        if subtype == "ICHLOR" and PRIM_ATTR in attribute_keys:
+            # IntelliChlor output percentage controls (CONFIG category)
+            body_attr = pool_obj[BODY_ATTR]
+            if body_attr is None:
+                continue
+
+            # The first body maps to the primary output, the second (if any) to
+            # the secondary. Only create entities for bodies that are configured.
+            for attribute_key, body_id in zip(
+                (PRIM_ATTR, SEC_ATTR), body_attr.split(), strict=False
+            ):
+                body = model[body_id]
+                if body is not None:
                     numbers.append(
                         PoolNumber(
                             coordinator,
                             pool_obj,
-                            min_value=ORP_SETPOINT_MIN,
-                            max_value=ORP_SETPOINT_MAX,
-                            step=ORP_SETPOINT_STEP,
-                            attribute_key=ORPSET_ATTR,
-                            name="+ ORP Setpoint",
-                            icon="mdi:test-tube",
-                            unit_of_measurement="mV",
+                            unit_of_measurement=PERCENTAGE,
+                            attribute_key=attribute_key,
+                            name=f"+ Output % ({body.sname})",
                             mode=NumberMode.BOX,
                             entity_category=EntityCategory.CONFIG,
                             integer_only=True,
                         )
                     )
 
-                # IntelliChem water chemistry configuration (CONFIG category)
-                # These are user-entered values, not sensor readings
-                if ALK_ATTR in pool_obj.attribute_keys:
-                    numbers.append(
-                        PoolNumber(
-                            coordinator,
-                            pool_obj,
-                            min_value=ALK_MIN,
-                            max_value=ALK_MAX,
-                            step=ALK_STEP,
-                            attribute_key=ALK_ATTR,
-                            name="+ Alkalinity",
-                            icon="mdi:flask-outline",
-                            unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-                            mode=NumberMode.BOX,
-                            entity_category=EntityCategory.CONFIG,
-                            integer_only=True,
-                        )
-                    )
+        elif subtype == "ICHEM":
+            # Several membership checks follow; take one hashed snapshot
+            attribute_keys = frozenset(attribute_keys)
 
-                if CALC_ATTR in pool_obj.attribute_keys:
-                    numbers.append(
-                        PoolNumber(
-                            coordinator,
-                            pool_obj,
-                            min_value=CALC_MIN,
-                            max_value=CALC_MAX,
-                            step=CALC_STEP,
-                            attribute_key=CALC_ATTR,
-                            name="+ Calcium Hardness",
-                            icon="mdi:flask-outline",
-                            unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-                            mode=NumberMode.BOX,
-                            entity_category=EntityCategory.CONFIG,
-                            integer_only=True,
-                        )
-                    )
-
-                if CYACID_ATTR in pool_obj.attribute_keys:
-                    numbers.append(
-                        PoolNumber(
-                            coordinator,
-                            pool_obj,
-                            min_value=CYACID_MIN,
-                            max_value=CYACID_MAX,
-                            step=CYACID_STEP,
-                            attribute_key=CYACID_ATTR,
-                            name="+ Cyanuric Acid",
-                            icon="mdi:flask-outline",
-                            unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-                            mode=NumberMode.BOX,
-                            entity_category=EntityCategory.CONFIG,
-                            integer_only=True,
-                        )
-                    )
-
-    # Add body max temperature setpoints (HITMP) - CONFIG category
-    for pool_obj in coordinator.model:
-        if pool_obj.objtype == BODY_TYPE and HITMP_ATTR in pool_obj.attribute_keys:
-            numbers.append(
+            numbers.extend(
                 PoolNumber(
-                    coordinator,
-                    pool_obj,
-                    min_value=TEMP_SETPOINT_MIN,
-                    max_value=TEMP_SETPOINT_MAX,
-                    step=TEMP_SETPOINT_STEP,
-                    attribute_key=HITMP_ATTR,
-                    name="+ Max Temperature",
-                    icon="mdi:thermometer-high",
-                    device_class=NumberDeviceClass.TEMPERATURE,
-                    mode=NumberMode.BOX,
-                    entity_category=EntityCategory.CONFIG,
-                    integer_only=True,
+                    coordinator, pool_obj, *_RANGES[attr], attribute_key=attr, **kwargs
                 )
+                for attr, kwargs in _ICHEM_NUMBERS
+                if attr in attribute_keys
             )
 
-    async_add_entities(numbers)
+    # Body max temperature setpoints (CONFIG category)
+    numbers.extend(
+        PoolNumber(
+            coordinator,
+            pool_obj,
+            *_RANGES[HITMP_ATTR],
+            attribute_key=HITMP_ATTR,
+            name="+ Max Temperature",
+            icon="mdi:thermometer-high",
+            device_class=NumberDeviceClass.TEMPERATURE,
+            mode=NumberMode.BOX,
+            entity_category=EntityCategory.CONFIG,
+            integer_only=True,
+        )
+        for pool_obj in coordinator.objects_of_type(BODY_TYPE)
+        if HITMP_ATTR in pool_obj.attribute_keys
+    )
+
+    # Skip entity registration entirely when nothing matched
+    if numbers:
+        async_add_entities(numbers)
 
 
 # -------------------------------------------------------------------------------------
@@ -239,6 +216,9 @@ async def async_setup_entry(
 class PoolNumber(PoolEntity, NumberEntity):
     """Representation of a pool number entity."""
 
+    # Only this class's own state; the HA base classes still carry a __dict__
+    __slots__ = ("_converter", "_integer_only", "_setter")
+
     _attr_icon = "mdi:gauge"
 
     def __init__(
@@ -275,50 +255,63 @@ class PoolNumber(PoolEntity, NumberEntity):
         self._integer_only = integer_only
         if device_class:
             self._attr_device_class = device_class
-        self._attr_mode = mode
+        if mode is not NumberMode.AUTO:
+            self._attr_mode = mode
         if entity_category:
             self._attr_entity_category = entity_category
 
+        # Resolve the controller convenience method once; the key never changes
+        self._setter: Callable[[str, float | int], Awaitable[Any]] | None = None
+        self._converter: Callable[[float], float | int] = int
+        dispatch = _SETPOINT_DISPATCH.get(self._attribute_key)
+        if dispatch is not None:
+            method_name, self._converter = dispatch
+            self._setter = getattr(coordinator.controller, method_name)
+
     @property
     def native_value(self) -> float | int | None:
         """Return the current value."""
-        value = self._safe_float_conversion(self._pool_object[self._attribute_key])
-        if value is not None and self._integer_only:
-            return int(value)
-        return value
+        raw = self._pool_object[self._attribute_key]
+        if raw is None:
+            return None
+        try:
+            value = float(raw)
+        except (ValueError, TypeError):
+            return None
+        return int(value) if self._integer_only else value
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value.
 
         Uses pyintellicenter convenience methods for validated setpoint changes.
         """
-        controller = self._controller
         objnam = self._pool_object.objnam
 
-        # Dispatch table for convenience methods
-        # Maps attribute key to (method_name, value_converter)
-        dispatch: dict[str, tuple[str, Callable[[float], float | int]]] = {
-            PHSET_ATTR: ("set_ph_setpoint", lambda v: v),  # pH needs float
-            ORPSET_ATTR: ("set_orp_setpoint", int),
-            PRIM_ATTR: ("set_chlorinator_output", int),
-            ALK_ATTR: ("set_alkalinity", int),
-            CALC_ATTR: ("set_calcium_hardness", int),
-            CYACID_ATTR: ("set_cyanuric_acid", int),
-        }
+        # NaN passes the min/max check; int() rejects it and infinities
+        try:
+            converted = self._converter(value)
+        except (ValueError, OverflowError) as err:
+            _LOGGER.warning("Invalid setpoint value for %s: %s", objnam, err)
+            return
+
+        request: Awaitable[Any]
+        if self._setter is not None:
+            request = self._setter(objnam, converted)
+        elif self._attribute_key == SEC_ATTR:
+            # Secondary chlorinator needs current primary preserved; push
+            # updates keep it current on our own PoolObject
+            primary = self._safe_int_conversion(self._pool_object[PRIM_ATTR]) or 0
+            request = self._controller.set_chlorinator_output(
+                objnam, primary, converted
+            )
+        else:
+            # Fallback for other number entities (e.g., HITMP); request_changes
+            # schedules the write and logs its own failures
+            self.request_changes({self._attribute_key: f"{converted}"})
+            return
 
         try:
-            if self._attribute_key in dispatch:
-                method_name, converter = dispatch[self._attribute_key]
-                method = getattr(controller, method_name)
-                await method(objnam, converter(value))
-            elif self._attribute_key == SEC_ATTR:
-                # Secondary chlorinator needs current primary preserved
-                current = controller.get_chlorinator_output(objnam)
-                primary = current.get("primary") or 0
-                await controller.set_chlorinator_output(objnam, primary, int(value))
-            else:
-                # Fallback for other number entities (e.g., HITMP)
-                self.request_changes({self._attribute_key: str(int(value))})
+            await request
         except ValueError as err:
             _LOGGER.warning("Invalid setpoint value for %s: %s", objnam, err)
         except Exception:
@@ -11,7 +11,10 @@ as they are user-entered configuration, not sensor readings.
 
 from __future__ import annotations
 
+from collections.abc import Callable, Collection, Iterator, Mapping
+from dataclasses import dataclass
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -23,7 +26,7 @@ from homeassistant.const import (
     CONCENTRATION_PARTS_PER_MILLION,
     UnitOfPower,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyintellicenter import (
@@ -58,6 +61,179 @@ _LOGGER = logging.getLogger(__name__)
 # Coordinator handles updates via push, so no parallel update limit needed
 PARALLEL_UPDATES = 0
 
+# Marks a sensor value that has not been converted yet
+_UNSET = object()
+
+# -------------------------------------------------------------------------------------
+
+
+def _always(obj: PoolObject, keys: Collection[str], key: str) -> bool:
+    """Create the sensor for every object of the type."""
+    return True
+
+
+def _has_attribute(obj: PoolObject, keys: Collection[str], key: str) -> bool:
+    """Create the sensor when the object reports the attribute."""
+    return key in keys
+
+
+def _has_value(obj: PoolObject, keys: Collection[str], key: str) -> bool:
+    """Create the sensor when the attribute has a truthy value."""
+    return bool(obj[key])
+
+
+def _has_positive_value(obj: PoolObject, keys: Collection[str], key: str) -> bool:
+    """Create the sensor when the attribute is reported and greater than zero."""
+    if key not in keys:
+        return False
+    value = obj[key]
+    return bool(value) and int(value) > 0
+
+
+def _kwargs(*parts: Mapping[str, Any], **kwargs: Any) -> Mapping[str, Any]:
+    """Merge PoolSensor constructor kwargs into a read-only mapping."""
+    merged: dict[str, Any] = {}
+    for part in parts:
+        merged.update(part)
+    merged.update(kwargs)
+    return MappingProxyType(merged)
+
+
+@dataclass(frozen=True, slots=True)
+class _SensorSpec:
+    """Describe a sensor created for matching pool objects."""
+
+    attribute_key: str
+    kwargs: Mapping[str, Any]
+    subtype: str | None = None
+    condition: Callable[[PoolObject, Collection[str], str], bool] = _has_attribute
+
+    def matches(self, obj: PoolObject, keys: Collection[str]) -> bool:
+        """Return True if this sensor applies to the pool object.
+
+        Args:
+            obj: The pool object to check
+            keys: The object's attribute keys, read once by the caller
+        """
+        if self.subtype is not None and obj.subtype != self.subtype:
+            return False
+        return self.condition(obj, keys, self.attribute_key)
+
+
+# Constructor kwargs shared by several sensors
+_DIAGNOSTIC = _kwargs(device_class=None, entity_category=EntityCategory.DIAGNOSTIC)
+_PUMP_RPM_LIMIT = _kwargs(_DIAGNOSTIC, unit_of_measurement=CONST_RPM)
+_PUMP_GPM_LIMIT = _kwargs(_DIAGNOSTIC, unit_of_measurement=CONST_GPM)
+_TANK_LEVEL = _kwargs(_DIAGNOSTIC, icon="mdi:barrel")
+
+# Sensors to create, keyed by object type
+_SENSORS: dict[str, tuple[_SensorSpec, ...]] = {
+    SENSE_TYPE: (
+        _SensorSpec(
+            SOURCE_ATTR,
+            _kwargs(device_class=SensorDeviceClass.TEMPERATURE),
+            condition=_always,
+        ),
+    ),
+    PUMP_TYPE: (
+        _SensorSpec(
+            PWR_ATTR,
+            _kwargs(
+                device_class=SensorDeviceClass.POWER,
+                unit_of_measurement=UnitOfPower.WATT,
+                name="+ power",
+                rounding_factor=25,
+            ),
+            condition=_has_value,
+        ),
+        _SensorSpec(
+            RPM_ATTR,
+            _kwargs(device_class=None, unit_of_measurement=CONST_RPM, name="+ rpm"),
+            condition=_has_value,
+        ),
+        _SensorSpec(
+            GPM_ATTR,
+            _kwargs(device_class=None, unit_of_measurement=CONST_GPM, name="+ gpm"),
+            condition=_has_value,
+        ),
+        # Pump operational limits (diagnostic sensors)
+        _SensorSpec(
+            MAX_ATTR,
+            _kwargs(_PUMP_RPM_LIMIT, name="+ Max RPM", icon="mdi:speedometer"),
+        ),
+        _SensorSpec(
+            MIN_ATTR,
+            _kwargs(_PUMP_RPM_LIMIT, name="+ Min RPM", icon="mdi:speedometer-slow"),
+        ),
+        _SensorSpec(
+            MAXF_ATTR,
+            _kwargs(_PUMP_GPM_LIMIT, name="+ Max GPM", icon="mdi:water-pump"),
+            condition=_has_positive_value,
+        ),
+        _SensorSpec(
+            MINF_ATTR,
+            _kwargs(_PUMP_GPM_LIMIT, name="+ Min GPM", icon="mdi:water-pump-off"),
+            condition=_has_positive_value,
+        ),
+    ),
+    # Note: ALK, CALC, CYACID are configuration values (user-entered)
+    # and are handled as number entities in number.py
+    CHEM_TYPE: (
+        _SensorSpec(
+            PHVAL_ATTR,
+            _kwargs(device_class=SensorDeviceClass.PH, name="+ (pH)"),
+            subtype="ICHEM",
+        ),
+        _SensorSpec(
+            ORPVAL_ATTR,
+            _kwargs(
+                device_class=None,
+                name="+ (ORP)",
+                icon="mdi:react",
+                unit_of_measurement="mV",
+            ),
+            subtype="ICHEM",
+        ),
+        _SensorSpec(
+            QUALTY_ATTR,
+            _kwargs(device_class=None, name="+ (Water Quality)", icon="mdi:test-tube"),
+            subtype="ICHEM",
+        ),
+        _SensorSpec(
+            PHTNK_ATTR,
+            _kwargs(_TANK_LEVEL, name="+ (pH Tank Level)"),
+            subtype="ICHEM",
+        ),
+        _SensorSpec(
+            ORPTNK_ATTR,
+            _kwargs(_TANK_LEVEL, name="+ (ORP Tank Level)"),
+            subtype="ICHEM",
+        ),
+        _SensorSpec(
+            SALT_ATTR,
+            _kwargs(
+                device_class=None,
+                unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
+                name="+ (Salt)",
+                icon="mdi:shaker-outline",
+            ),
+            subtype="ICHLOR",
+        ),
+    ),
+    SYSTEM_TYPE: (
+        # Firmware version (diagnostic sensor, non-numeric string value)
+        _SensorSpec(
+            VER_ATTR,
+            _kwargs(
+                _DIAGNOSTIC,
+                name="Firmware Version",
+                icon="mdi:chip",
+                state_class=None,  # Non-numeric value
+            ),
+        ),
+    ),
+}
+
 # -------------------------------------------------------------------------------------
 
 
@@ -67,207 +243,24 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Load pool sensors based on a config entry."""
-    coordinator = entry.runtime_data
+    async_add_entities(_iter_sensors(entry.runtime_data))
 
-    sensors: list[PoolSensor] = []
 
+def _iter_sensors(coordinator: IntelliCenterCoordinator) -> Iterator[PoolSensor]:
+    """Yield the sensors described by _SENSORS for the coordinator's model."""
     obj: PoolObject
-    for obj in coordinator.model:
-        if obj.objtype == SENSE_TYPE:
-            sensors.append(
-                PoolSensor(
-                    coordinator,
-                    obj,
-                    device_class=SensorDeviceClass.TEMPERATURE,
-                    attribute_key=SOURCE_ATTR,
-                )
-            )
-        elif obj.objtype == PUMP_TYPE:
-            if obj[PWR_ATTR]:
-                sensors.append(
-                    PoolSensor(
-                        coordinator,
-                        obj,
-                        device_class=SensorDeviceClass.POWER,
-                        unit_of_measurement=UnitOfPower.WATT,
-                        attribute_key=PWR_ATTR,
-                        name="+ power",
-                        rounding_factor=25,
-                    )
-                )
-            if obj[RPM_ATTR]:
-                sensors.append(
-                    PoolSensor(
-                        coordinator,
-                        obj,
-                        device_class=None,
-                        unit_of_measurement=CONST_RPM,
-                        attribute_key=RPM_ATTR,
-                        name="+ rpm",
-                    )
-                )
-            if obj[GPM_ATTR]:
-                sensors.append(
-                    PoolSensor(
-                        coordinator,
-                        obj,
-                        device_class=None,
-                        unit_of_measurement=CONST_GPM,
-                        attribute_key=GPM_ATTR,
-                        name="+ gpm",
-                    )
-                )
-            # Pump operational limits (diagnostic sensors)
-            if MAX_ATTR in obj.attribute_keys:
-                sensors.append(
-                    PoolSensor(
-                        coordinator,
-                        obj,
-                        device_class=None,
-                        unit_of_measurement=CONST_RPM,
-                        attribute_key=MAX_ATTR,
-                        name="+ Max RPM",
-                        icon="mdi:speedometer",
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-            if MIN_ATTR in obj.attribute_keys:
-                sensors.append(
-                    PoolSensor(
-                        coordinator,
-                        obj,
-                        device_class=None,
-                        unit_of_measurement=CONST_RPM,
-                        attribute_key=MIN_ATTR,
-                        name="+ Min RPM",
-                        icon="mdi:speedometer-slow",
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-            if (
-                MAXF_ATTR in obj.attribute_keys
-                and obj[MAXF_ATTR]
-                and int(obj[MAXF_ATTR]) > 0
-            ):
-                sensors.append(
-                    PoolSensor(
+    for objtype, specs in _SENSORS.items():
+        for obj in coordinator.objects_of_type(objtype):
+            # One hashed snapshot serves every spec's membership check
+            keys = frozenset(obj.attribute_keys)
+            for spec in specs:
+                if spec.matches(obj, keys):
+                    yield PoolSensor(
                         coordinator,
                         obj,
-                        device_class=None,
-                        unit_of_measurement=CONST_GPM,
-                        attribute_key=MAXF_ATTR,
-                        name="+ Max GPM",
-                        icon="mdi:water-pump",
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-            if (
-                MINF_ATTR in obj.attribute_keys
-                and obj[MINF_ATTR]
-                and int(obj[MINF_ATTR]) > 0
-            ):
-                sensors.append(
-                    PoolSensor(
-                        coordinator,
-                        obj,
-                        device_class=None,
-                        unit_of_measurement=CONST_GPM,
-                        attribute_key=MINF_ATTR,
-                        name="+ Min GPM",
-                        icon="mdi:water-pump-off",
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-        elif obj.objtype == CHEM_TYPE:
-            if obj.subtype == "ICHEM":
-                if PHVAL_ATTR in obj.attribute_keys:
-                    sensors.append(
-                        PoolSensor(
-                            coordinator,
-                            obj,
-                            device_class=SensorDeviceClass.PH,
-                            attribute_key=PHVAL_ATTR,
-                            name="+ (pH)",
-                        )
-                    )
-                if ORPVAL_ATTR in obj.attribute_keys:
-                    sensors.append(
-                        PoolSensor(
-                            coordinator,
-                            obj,
-                            device_class=None,
-                            attribute_key=ORPVAL_ATTR,
-                            name="+ (ORP)",
-                            icon="mdi:react",
-                            unit_of_measurement="mV",
-                        )
-                    )
-                if QUALTY_ATTR in obj.attribute_keys:
-                    sensors.append(
-                        PoolSensor(
-                            coordinator,
-                            obj,
-                            device_class=None,
-                            attribute_key=QUALTY_ATTR,
-                            name="+ (Water Quality)",
-                            icon="mdi:test-tube",
-                        )
-                    )
-                if PHTNK_ATTR in obj.attribute_keys:
-                    sensors.append(
-                        PoolSensor(
-                            coordinator,
-                            obj,
-                            device_class=None,
-                            attribute_key=PHTNK_ATTR,
-                            name="+ (pH Tank Level)",
-                            icon="mdi:barrel",
-                            entity_category=EntityCategory.DIAGNOSTIC,
-                        )
+                        attribute_key=spec.attribute_key,
+                        **spec.kwargs,
                     )
-                if ORPTNK_ATTR in obj.attribute_keys:
-                    sensors.append(
-                        PoolSensor(
-                            coordinator,
-                            obj,
-                            device_class=None,
-                            attribute_key=ORPTNK_ATTR,
-                            name="+ (ORP Tank Level)",
-                            icon="mdi:barrel",
-                            entity_category=EntityCategory.DIAGNOSTIC,
-                        )
-                    )
-                # Note: ALK, CALC, CYACID are configuration values (user-entered)
-                # and are handled as number entities in number.py
-            elif obj.subtype == "ICHLOR":
-                if SALT_ATTR in obj.attribute_keys:
-                    sensors.append(
-                        PoolSensor(
-                            coordinator,
-                            obj,
-                            device_class=None,
-                            unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-                            attribute_key=SALT_ATTR,
-                            name="+ (Salt)",
-                            icon="mdi:shaker-outline",
-                        )
-                    )
-        elif obj.objtype == SYSTEM_TYPE:
-            # Firmware version (diagnostic sensor, non-numeric string value)
-            if VER_ATTR in obj.attribute_keys:
-                sensors.append(
-                    PoolSensor(
-                        coordinator,
-                        obj,
-                        device_class=None,
-                        attribute_key=VER_ATTR,
-                        name="Firmware Version",
-                        icon="mdi:chip",
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                        state_class=None,  # Non-numeric value
-                    )
-                )
-    async_add_entities(sensors)
 
 
 # -------------------------------------------------------------------------------------
@@ -280,6 +273,14 @@ class PoolSensor(PoolEntity, SensorEntity):
     value rounding for sensors with high update frequency.
     """
 
+    __slots__ = (
+        "_cache_valid",
+        "_cached_value",
+        "_is_temperature",
+        "_previous_value",
+        "_rounding_factor",
+    )
+
     def __init__(
         self,
         coordinator: IntelliCenterCoordinator,
@@ -303,12 +304,56 @@ class PoolSensor(PoolEntity, SensorEntity):
         """
         super().__init__(coordinator, pool_object, **kwargs)
         self._attr_device_class = device_class
+        self._is_temperature = device_class == SensorDeviceClass.TEMPERATURE
+        if self._is_temperature:
+            self._attr_native_unit_of_measurement = self.pentairTemperatureSettings()
         self._rounding_factor = rounding_factor
         if state_class is not None:
             self._attr_state_class = state_class
         if entity_category:
             self._attr_entity_category = entity_category
 
+        # Converted value, reused until the underlying attribute changes
+        self._cached_value: float | int | str | None = None
+        self._cache_valid = False
+        # Converted value from before the update being handled
+        self._previous_value: object = _UNSET
+
+    def isUpdated(self, updates: dict[str, dict[str, Any]]) -> bool:
+        """Return true if the sensor's attribute is in the updates."""
+        previous = self._cached_value if self._cache_valid else _UNSET
+        updated = super().isUpdated(updates)
+        if updated:
+            self._previous_value = previous
+            self._cache_valid = False
+        return updated
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if not self.coordinator.data:
+            # Connection state change; the model may have been reloaded
+            self._cache_valid = False
+            if self._is_temperature:
+                # Pick up a change to the system's unit preference
+                self._attr_native_unit_of_measurement = (
+                    self.pentairTemperatureSettings()
+                )
+        super()._handle_coordinator_update()
+
+    def _should_write_state(self) -> bool:
+        """Return true if the converted value or the unit changed.
+
+        Attribute churn that rounds to the same value is dropped.
+        """
+        unit = self._attr_native_unit_of_measurement
+        if self._is_temperature:
+            self._attr_native_unit_of_measurement = self.pentairTemperatureSettings()
+        return (
+            self.native_value != self._previous_value
+            or self._attr_native_unit_of_measurement != unit
+        )
+
     @property
     def native_value(self) -> float | int | str | None:
         """Return the native value of the sensor.
@@ -317,27 +362,25 @@ class PoolSensor(PoolEntity, SensorEntity):
         so rounding their value to a nearest multiplier of 'rounding_factor'
         smooths the curve and limits the number of updates in the log.
         """
+        if not self._cache_valid:
+            self._cached_value = self._convert_value()
+            self._cache_valid = True
+        return self._cached_value
+
+    def _convert_value(self) -> float | int | str | None:
+        """Convert the raw attribute value to the sensor's native value."""
         raw_value = self._pool_object[self._attribute_key]
         if raw_value is None:
             return None
 
-        try:
-            value = int(raw_value)
-            if self._rounding_factor:
-                value = int(
-                    round(value / self._rounding_factor) * self._rounding_factor
-                )
-            return value
-        except (ValueError, TypeError):
-            # Return as-is if not convertible to int (e.g., pH values as float)
+        if isinstance(raw_value, str) and not raw_value.removeprefix("-").isdecimal():
+            # Not an integer (e.g., pH values as float); return as-is if not numeric
             try:
                 return float(raw_value)
-            except (ValueError, TypeError):
-                return str(raw_value)
+            except ValueError:
+                return raw_value
 
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return the unit of measurement of this entity, if any."""
-        if self._attr_device_class == SensorDeviceClass.TEMPERATURE:
-            return self.pentairTemperatureSettings()
-        return self._attr_native_unit_of_measurement
+        value = int(raw_value)
+        if self._rounding_factor:
+            value = int(round(value / self._rounding_factor) * self._rounding_factor)
+        return value
@@ -6,6 +6,7 @@ superchlorinate mode, and vacation mode.
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 import logging
 from typing import Any
 
@@ -35,6 +36,9 @@ _LOGGER = logging.getLogger(__name__)
 # Coordinator handles updates via push, so no parallel update limit needed
 PARALLEL_UPDATES = 0
 
+# Extra state attributes exposed by body switches
+_BODY_EXTRA_ATTRS = (VOL_ATTR, HEATER_ATTR, HTMODE_ATTR)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -42,45 +46,71 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Load Pentair switch entities based on a config entry."""
-    coordinator = entry.runtime_data
+    async_add_entities(_iter_switches(entry.runtime_data))
+
+
+def _body_switch(
+    coordinator: IntelliCenterCoordinator, pool_obj: PoolObject
+) -> PoolEntity | None:
+    """Return the on/off switch for a body of water."""
+    return PoolBody(coordinator, pool_obj)
+
+
+def _superchlorinate_switch(
+    coordinator: IntelliCenterCoordinator, pool_obj: PoolObject
+) -> PoolEntity | None:
+    """Return the superchlorinate switch for an IntelliChlor, if supported."""
+    if SUPER_ATTR not in pool_obj.attribute_keys:
+        return None
+    return PoolCircuit(
+        coordinator,
+        pool_obj,
+        attribute_key=SUPER_ATTR,
+        name="+ Superchlorinate",
+        icon="mdi:alpha-s-box-outline",
+    )
+
+
+def _circuit_switch(
+    coordinator: IntelliCenterCoordinator, pool_obj: PoolObject
+) -> PoolEntity | None:
+    """Return a switch for a featured circuit or a circuit group."""
+    is_light = pool_obj.is_a_light or pool_obj.is_a_light_show
+    if not is_light and pool_obj.is_featured:
+        return PoolCircuit(coordinator, pool_obj, icon="mdi:alpha-f-box-outline")
+    if pool_obj.subtype == "CIRCGRP":
+        return PoolCircuit(coordinator, pool_obj, icon="mdi:alpha-g-box-outline")
+    return None
+
+
+def _vacation_switch(
+    coordinator: IntelliCenterCoordinator, pool_obj: PoolObject
+) -> PoolEntity | None:
+    """Return the vacation mode switch for the system object."""
+    return PoolVacation(coordinator, pool_obj)
+
+
+type _SwitchFactory = Callable[
+    [IntelliCenterCoordinator, PoolObject], PoolEntity | None
+]
+
+# (object type, subtype or None for all) -> factory returning a switch or None
+_SWITCH_FACTORIES: tuple[tuple[str, str | None, _SwitchFactory], ...] = (
+    (BODY_TYPE, None, _body_switch),
+    (CHEM_TYPE, "ICHLOR", _superchlorinate_switch),
+    (CIRCUIT_TYPE, None, _circuit_switch),
+    (SYSTEM_TYPE, None, _vacation_switch),
+)
 
-    switches: list[PoolCircuit] = []
 
+def _iter_switches(coordinator: IntelliCenterCoordinator) -> Iterator[PoolEntity]:
+    """Yield the switch entities described by _SWITCH_FACTORIES."""
     pool_obj: PoolObject
-    for pool_obj in coordinator.model:
-        if pool_obj.objtype == BODY_TYPE:
-            switches.append(PoolBody(coordinator, pool_obj))
-        elif (
-            pool_obj.objtype == CHEM_TYPE
-            and pool_obj.subtype == "ICHLOR"
-            and SUPER_ATTR in pool_obj.attribute_keys
-        ):
-            switches.append(
-                PoolCircuit(
-                    coordinator,
-                    pool_obj,
-                    attribute_key=SUPER_ATTR,
-                    name="+ Superchlorinate",
-                    icon="mdi:alpha-s-box-outline",
-                )
-            )
-        elif (
-            pool_obj.objtype == CIRCUIT_TYPE
-            and not (pool_obj.is_a_light or pool_obj.is_a_light_show)
-            and pool_obj.is_featured
-        ):
-            switches.append(
-                PoolCircuit(coordinator, pool_obj, icon="mdi:alpha-f-box-outline")
-            )
-        elif pool_obj.objtype == CIRCUIT_TYPE and pool_obj.subtype == "CIRCGRP":
-            switches.append(
-                PoolCircuit(coordinator, pool_obj, icon="mdi:alpha-g-box-outline")
-            )
-        elif pool_obj.objtype == SYSTEM_TYPE:
-            # Vacation mode uses convenience method
-            switches.append(PoolVacation(coordinator, pool_obj))
-
-    async_add_entities(switches)
+    for objtype, subtype, factory in _SWITCH_FACTORIES:
+        for pool_obj in coordinator.objects_of_type(objtype, subtype):
+            switch = factory(coordinator, pool_obj)
+            if switch is not None:
+                yield switch
 
 
 class PoolCircuit(PoolEntity, OnOffControlMixin, SwitchEntity):
@@ -124,7 +154,7 @@ class PoolBody(PoolCircuit):
     ) -> None:
         """Initialize a Pool body from the underlying circuit."""
         super().__init__(coordinator, pool_object)
-        self._extra_state_attrs = {VOL_ATTR, HEATER_ATTR, HTMODE_ATTR}
+        self._extra_state_attrs = _BODY_EXTRA_ATTRS
 
 
 class PoolVacation(PoolEntity, SwitchEntity):
@@ -162,16 +192,21 @@ class PoolVacation(PoolEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable vacation mode using convenience method."""
-        self._optimistic_state = True
-        self.async_write_ha_state()
+        self._set_optimistic_state(True)
         await self._controller.set_vacation_mode(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable vacation mode using convenience method."""
-        self._optimistic_state = False
-        self.async_write_ha_state()
+        self._set_optimistic_state(False)
         await self._controller.set_vacation_mode(False)
 
+    @callback
+    def _set_optimistic_state(self, state: bool) -> None:
+        """Show the requested state right away unless it is already shown."""
+        if self.is_on != state:
+            self._optimistic_state = state
+            self.async_write_ha_state()
+
     @callback
     def _clear_optimistic_state(self) -> None:
         """Clear optimistic state when real update is received."""
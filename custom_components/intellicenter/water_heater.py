@@ -7,6 +7,8 @@ last used heater for convenient turn-on operations.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from functools import cached_property
 import logging
 from typing import Any
 
@@ -14,8 +16,14 @@ from homeassistant.components.water_heater import (
     WaterHeaterEntity,
     WaterHeaterEntityFeature,
 )
-from homeassistant.const import ATTR_TEMPERATURE, STATE_IDLE, STATE_OFF, STATE_ON
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    ATTR_TEMPERATURE,
+    STATE_IDLE,
+    STATE_OFF,
+    STATE_ON,
+    UnitOfTemperature,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from pyintellicenter import (
@@ -28,6 +36,7 @@ from pyintellicenter import (
     LOTMP_ATTR,
     LSTTMP_ATTR,
     NULL_OBJNAM,
+    SNAME_ATTR,
     STATUS_ATTR,
     STATUS_OFF,
     PoolObject,
@@ -41,6 +50,17 @@ _LOGGER = logging.getLogger(__name__)
 # Coordinator handles updates via push, so no parallel update limit needed
 PARALLEL_UPDATES = 0
 
+# Native temperature unit -> (min, max) target temperature
+_TEMP_BOUNDS: dict[str, tuple[float, float]] = {
+    str(UnitOfTemperature.CELSIUS): (5.0, 40.0),
+    str(UnitOfTemperature.FAHRENHEIT): (4.0, 104.0),
+}
+
+# Body attributes that affect a water heater's state
+_TRACKED_HEATER_ATTRS = frozenset(
+    {STATUS_ATTR, HEATER_ATTR, HTMODE_ATTR, LOTMP_ATTR, LSTTMP_ATTR}
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -60,17 +80,21 @@ async def async_setup_entry(
         key=lambda h: int(h[LISTORD_ATTR]) if h[LISTORD_ATTR] else 100,
     )
 
-    bodies = coordinator.model.get_by_type(BODY_TYPE)
+    # then map each body to the heaters that support it, keeping the UI order;
+    # heaters referencing unknown bodies are ignored
+    bodies = coordinator.objects_of_type(BODY_TYPE)
+    body_to_heaters: dict[str, list[str]] = {body.objnam: [] for body in bodies}
+    heater: PoolObject
+    for heater in heaters:
+        for body_objnam in heater[BODY_ATTR].split(" "):
+            heater_list = body_to_heaters.get(body_objnam)
+            if heater_list is not None:
+                heater_list.append(heater.objnam)
 
     water_heaters = []
     body: PoolObject
     for body in bodies:
-        heater_list = []
-        heater: PoolObject
-        for heater in heaters:
-            # if the heater supports this body, add it to the list
-            if body.objnam in heater[BODY_ATTR].split(" "):
-                heater_list.append(heater.objnam)
+        heater_list = body_to_heaters[body.objnam]
         if heater_list:
             water_heaters.append(PoolWaterHeater(coordinator, body, heater_list))
 
@@ -85,6 +109,10 @@ class PoolWaterHeater(PoolEntity, WaterHeaterEntity, RestoreEntity):
 
     LAST_HEATER_ATTR = "LAST_HEATER"
     _attr_icon = "mdi:thermometer"
+    _attr_supported_features = (
+        WaterHeaterEntityFeature.TARGET_TEMPERATURE
+        | WaterHeaterEntityFeature.OPERATION_MODE
+    )
 
     def __init__(
         self,
@@ -100,42 +128,48 @@ class PoolWaterHeater(PoolEntity, WaterHeaterEntity, RestoreEntity):
         )
         self._heater_list = heater_list
         self._last_heater: str | None = self._pool_object[HEATER_ATTR]
+        # Built on first read, dropped whenever a tracked attribute changes
+        self._cached_extra_attrs: dict[str, Any] | None = None
+        self._cached_state: str | None = None
+        # The heater roster is fixed; only a heater rename changes these
+        self._heater_to_sname: dict[str, str] = {}
+        self._sname_to_heater: dict[str, str] = {}
+        self._refresh_heater_names()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the entity."""
+        if self._cached_extra_attrs is not None:
+            return self._cached_extra_attrs
 
         state_attributes = super().extra_state_attributes
 
         if self._last_heater != NULL_OBJNAM:
             state_attributes[self.LAST_HEATER_ATTR] = self._last_heater
 
+        self._cached_extra_attrs = state_attributes
         return state_attributes
 
     @property
     def state(self) -> str:
         """Return the current state."""
-        status = self._pool_object[STATUS_ATTR]
-        heater = self._pool_object[HEATER_ATTR]
-        if status == STATUS_OFF or heater == NULL_OBJNAM:
-            return str(STATE_OFF)
-        htmode = self._pool_object[HTMODE_ATTR]
-        return str(STATE_ON) if htmode != "0" else str(STATE_IDLE)
+        if self._cached_state is None:
+            pool_obj = self._pool_object
+            status = pool_obj[STATUS_ATTR]
+            if status == STATUS_OFF or pool_obj[HEATER_ATTR] == NULL_OBJNAM:
+                self._cached_state = STATE_OFF
+            else:
+                self._cached_state = (
+                    STATE_ON if pool_obj[HTMODE_ATTR] != "0" else STATE_IDLE
+                )
+        return self._cached_state
 
-    @property
+    @cached_property
     def unique_id(self) -> str:
         """Return a unique ID."""
         base_id = super().unique_id
         return f"{base_id}{LOTMP_ATTR}"
 
-    @property
-    def supported_features(self) -> WaterHeaterEntityFeature:
-        """Return the list of supported features."""
-        return (
-            WaterHeaterEntityFeature.TARGET_TEMPERATURE
-            | WaterHeaterEntityFeature.OPERATION_MODE
-        )
-
     @property
     def temperature_unit(self) -> str:
         """Return the unit of measurement used by the platform."""
@@ -144,14 +178,12 @@ class PoolWaterHeater(PoolEntity, WaterHeaterEntity, RestoreEntity):
     @property
     def min_temp(self) -> float:
         """Return the minimum value."""
-        system_info = self.coordinator.system_info
-        return 5.0 if system_info and system_info.uses_metric else 4.0
+        return _TEMP_BOUNDS[self.coordinator.temperature_unit][0]
 
     @property
     def max_temp(self) -> float:
         """Return the maximum temperature."""
-        system_info = self.coordinator.system_info
-        return 40.0 if system_info and system_info.uses_metric else 104.0
+        return _TEMP_BOUNDS[self.coordinator.temperature_unit][1]
 
     @property
     def current_temperature(self) -> float | None:
@@ -169,6 +201,10 @@ class PoolWaterHeater(PoolEntity, WaterHeaterEntity, RestoreEntity):
         if target_temperature is not None:
             try:
                 temp_value = int(target_temperature)
+                current = self._safe_int_conversion(self._pool_object[LOTMP_ATTR])
+                if current == temp_value:
+                    # Already the setpoint; skip the round-trip to the controller
+                    return
                 # Use pyintellicenter convenience method
                 await self._controller.set_setpoint(
                     self._pool_object.objnam, temp_value
@@ -179,33 +215,28 @@ class PoolWaterHeater(PoolEntity, WaterHeaterEntity, RestoreEntity):
     @property
     def current_operation(self) -> str:
         """Return current operation."""
-        heater = self._pool_object[HEATER_ATTR]
-        if heater in self._heater_list:
-            heater_obj = self.coordinator.model[heater]
-            if heater_obj is not None and heater_obj.sname is not None:
-                return str(heater_obj.sname)
-        return str(STATE_OFF)
+        return self._heater_to_sname.get(self._pool_object[HEATER_ATTR], STATE_OFF)
 
-    @property
-    def operation_list(self) -> list[str]:
-        """Return the list of available operation modes."""
-        operations: list[str] = [str(STATE_OFF)]
+    def _refresh_heater_names(self) -> None:
+        """Map heaters to their names and rebuild the operation modes."""
+        self._heater_to_sname = {}
         for heater in self._heater_list:
             heater_obj = self.coordinator.model[heater]
-            if heater_obj is not None and heater_obj.sname is not None:
-                operations.append(heater_obj.sname)
-        return operations
+            if heater_obj is not None and (sname := heater_obj.sname) is not None:
+                self._heater_to_sname[heater] = sname
+        # Walk in reverse so the first heater wins if two share a name
+        self._sname_to_heater = {
+            sname: heater for heater, sname in reversed(self._heater_to_sname.items())
+        }
+        self._attr_operation_list = [STATE_OFF, *self._heater_to_sname.values()]
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set new target operation mode."""
         if operation_mode == STATE_OFF:
             self._turn_off()
-        else:
-            for heater in self._heater_list:
-                heater_obj = self.coordinator.model[heater]
-                if heater_obj is not None and operation_mode == heater_obj.sname:
-                    self.request_changes({HEATER_ATTR: heater})
-                    break
+        elif (heater := self._sname_to_heater.get(operation_mode)) is not None:
+            if heater != self._pool_object[HEATER_ATTR]:
+                self.request_changes({HEATER_ATTR: heater})
 
     async def async_turn_on(self) -> None:
         """Turn the entity on."""
@@ -226,18 +257,38 @@ class PoolWaterHeater(PoolEntity, WaterHeaterEntity, RestoreEntity):
 
     def isUpdated(self, updates: dict[str, dict[str, Any]]) -> bool:
         """Return true if the entity is updated by the updates from Intellicenter."""
-        my_updates = updates.get(self._pool_object.objnam, {})
-
-        updated = bool(
-            my_updates
-            and {STATUS_ATTR, HEATER_ATTR, HTMODE_ATTR, LOTMP_ATTR, LSTTMP_ATTR}
-            & my_updates.keys()
+        renamed = any(
+            SNAME_ATTR in updates.get(heater, ()) for heater in self._heater_list
         )
+        if renamed:
+            # The operation modes are the heater names
+            self._refresh_heater_names()
+
+        my_updates = updates.get(self._pool_object.objnam)
+        if not my_updates or _TRACKED_HEATER_ATTRS.isdisjoint(my_updates):
+            return renamed
+
+        # Status, heater and mode feed both the state and its attributes
+        self._cached_extra_attrs = None
+        self._cached_state = None
+        heater = self._pool_object[HEATER_ATTR]
+        if heater != NULL_OBJNAM:
+            self._last_heater = heater
+
+        return True
 
-        if updated and self._pool_object[HEATER_ATTR] != NULL_OBJNAM:
-            self._last_heater = self._pool_object[HEATER_ATTR]
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if not self.coordinator.data:
+            # Connection change; the model may have been reloaded meanwhile
+            self._cached_state = None
+            self._cached_extra_attrs = None
+        super()._handle_coordinator_update()
 
-        return updated
+    def _listened_objnams(self) -> Iterable[str]:
+        """Return the body and the heaters that can serve it."""
+        return (self._pool_object.objnam, *self._heater_list)
 
     async def async_added_to_hass(self) -> None:
         """Entity is added to Home Assistant."""
@@ -252,3 +303,4 @@ class PoolWaterHeater(PoolEntity, WaterHeaterEntity, RestoreEntity):
                 value = last_state.attributes.get(self.LAST_HEATER_ATTR)
                 if value and value != NULL_OBJNAM:
                     self._last_heater = value
+                    self._cached_extra_attrs = None
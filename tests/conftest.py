@@ -1,11 +1,12 @@
 """Fixtures for Pentair IntelliCenter integration tests."""
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Mapping
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST
+from homeassistant.const import CONF_HOST, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from pyintellicenter import (
     BODY_TYPE,
@@ -29,6 +30,209 @@ from custom_components.intellicenter.coordinator import IntelliCenterCoordinator
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
+def _pool_object_data(objnam: str, params: dict[str, str]) -> Mapping[str, Any]:
+    """Return a read-only pool model entry in add_objects() form."""
+    return MappingProxyType({"objnam": objnam, "params": MappingProxyType(params)})
+
+
+# Pool model entries, shared by pool_model_data and the standalone pool object
+# fixtures; consumers copy the params since tests update objects in place
+
+# System object
+_SYS01 = _pool_object_data(
+    "SYS01",
+    {
+        "OBJTYP": SYSTEM_TYPE,
+        "SNAME": "IntelliCenter System",
+        "PROPNAME": "Test Pool System",
+        "MODE": "ENGLISH",
+        "VER": "2.0.0",
+        "STATUS": "READY",
+    },
+)
+
+# Pool body
+_POOL1 = _pool_object_data(
+    "POOL1",
+    {
+        "OBJTYP": BODY_TYPE,
+        "SUBTYP": "POOL",
+        "SNAME": "Pool",
+        "STATUS": "ON",
+        "LSTTMP": "78",
+        "LOTMP": "72",
+        "HEATER": "HTR01",
+        "HTMODE": "1",
+    },
+)
+
+# Spa body
+_SPA01 = _pool_object_data(
+    "SPA01",
+    {
+        "OBJTYP": BODY_TYPE,
+        "SUBTYP": "SPA",
+        "SNAME": "Spa",
+        "STATUS": "OFF",
+        "LSTTMP": "102",
+        "LOTMP": "80",
+        "HEATER": "HTR01",
+        "HTMODE": "0",
+    },
+)
+
+# IntelliBrite light (supports color effects)
+_LIGHT1 = _pool_object_data(
+    "LIGHT1",
+    {
+        "OBJTYP": CIRCUIT_TYPE,
+        "SUBTYP": "INTELLI",
+        "SNAME": "Pool Light",
+        "STATUS": "OFF",
+        "USE": "WHITER",
+        "FEATR": "ON",
+    },
+)
+
+# Regular light (no color effects)
+_LIGHT2 = _pool_object_data(
+    "LIGHT2",
+    {
+        "OBJTYP": CIRCUIT_TYPE,
+        "SUBTYP": "LIGHT",
+        "SNAME": "Spa Light",
+        "STATUS": "OFF",
+        "FEATR": "ON",
+    },
+)
+
+# Light show
+_SHOW1 = _pool_object_data(
+    "SHOW1",
+    {
+        "OBJTYP": CIRCUIT_TYPE,
+        "SUBTYP": "LITSHO",
+        "SNAME": "Party Show",
+        "STATUS": "OFF",
+        "FEATR": "ON",
+    },
+)
+
+# Featured circuit (switch)
+_CIRC01 = _pool_object_data(
+    "CIRC01",
+    {
+        "OBJTYP": CIRCUIT_TYPE,
+        "SUBTYP": "GENERIC",
+        "SNAME": "Pool Cleaner",
+        "STATUS": "OFF",
+        "FEATR": "ON",
+    },
+)
+
+# Non-featured circuit (should not create switch)
+_CIRC02 = _pool_object_data(
+    "CIRC02",
+    {
+        "OBJTYP": CIRCUIT_TYPE,
+        "SUBTYP": "GENERIC",
+        "SNAME": "Aux Circuit",
+        "STATUS": "OFF",
+        "FEATR": "OFF",
+    },
+)
+
+# Pump
+_PUMP1 = _pool_object_data(
+    "PUMP1",
+    {
+        "OBJTYP": PUMP_TYPE,
+        "SUBTYP": "VS",
+        "SNAME": "Pool Pump",
+        "STATUS": "10",
+        "PWR": "1200",
+        "RPM": "2000",
+        "GPM": "55",
+    },
+)
+
+# Heater
+_HTR01 = _pool_object_data(
+    "HTR01",
+    {
+        "OBJTYP": HEATER_TYPE,
+        "SUBTYP": "GAS",
+        "SNAME": "Gas Heater",
+        "STATUS": "OFF",
+        "BODY": "POOL1 SPA01",
+        "LISTORD": "1",
+    },
+)
+
+# Chemistry sensor (IntelliChem)
+_CHEM1 = _pool_object_data(
+    "CHEM1",
+    {
+        "OBJTYP": CHEM_TYPE,
+        "SUBTYP": "ICHEM",
+        "SNAME": "IntelliChem",
+        "PHVAL": "7.4",
+        "ORPVAL": "650",
+        "PHTNK": "5",
+        "ORPTNK": "3",
+    },
+)
+
+# Temperature sensor
+_SENSE1 = _pool_object_data(
+    "SENSE1",
+    {
+        "OBJTYP": SENSE_TYPE,
+        "SUBTYP": "AIR",
+        "SNAME": "Air Temp",
+        "SOURCE": "68",
+    },
+)
+
+# Schedule
+_SCHED1 = _pool_object_data(
+    "SCHED1",
+    {
+        "OBJTYP": SCHED_TYPE,
+        "SNAME": "Morning Filter",
+        "STATUS": "OFF",
+        "ENABLE": "ON",
+    },
+)
+
+
+# Controller coroutines stubbed on the mock coordinator's controller
+_CONTROLLER_ASYNC_METHODS = (
+    "request_changes",
+    # Convenience methods from pyintellicenter v0.1.2
+    "set_vacation_mode",
+    "set_ph_setpoint",
+    "set_orp_setpoint",
+    "set_chlorinator_output",
+    "set_light_effect",
+    "set_setpoint",
+    "set_heat_mode",
+    # Convenience methods from pyintellicenter v0.1.3
+    "set_alkalinity",
+    "set_calcium_hardness",
+    "set_cyanuric_acid",
+)
+
+# Controller getters stubbed with fixed return values
+_CONTROLLER_GETTERS = (
+    ("get_chlorinator_output", {"primary": 50, "secondary": 50}),
+    ("is_vacation_mode", False),
+    ("get_alkalinity", 100),
+    ("get_calcium_hardness", 300),
+    ("get_cyanuric_acid", 40),
+)
+
+
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations):
     """Enable custom integrations for all tests."""
@@ -39,11 +243,11 @@ def auto_enable_custom_integrations(enable_custom_integrations):
 def mock_system_info() -> ICSystemInfo:
     """Return a mock ICSystemInfo object."""
     mock_info = MagicMock(spec=ICSystemInfo)
-    # Configure property return values using PropertyMock
-    type(mock_info).unique_id = property(lambda self: "test-unique-id-123")
-    type(mock_info).prop_name = property(lambda self: "Test Pool System")
-    type(mock_info).sw_version = property(lambda self: "2.0.0")
-    type(mock_info).uses_metric = property(lambda self: False)
+    # Static values; plain attributes avoid patching the mock's class
+    mock_info.unique_id = "test-unique-id-123"
+    mock_info.prop_name = "Test Pool System"
+    mock_info.sw_version = "2.0.0"
+    mock_info.uses_metric = False
     return mock_info
 
 
@@ -61,164 +265,37 @@ def mock_controller(mock_system_info: ICSystemInfo) -> Generator[MagicMock]:
         yield mock_instance
 
 
+@pytest.fixture(scope="session")
+def pool_model_data_template() -> tuple[Mapping[str, Any], ...]:
+    """Return the complete pool model definition, built once per session.
+
+    Shared by every test; use pool_model_data for a copy that may be modified.
+    """
+    return (
+        _SYS01,
+        _POOL1,
+        _SPA01,
+        _LIGHT1,
+        _LIGHT2,
+        _SHOW1,
+        _CIRC01,
+        _CIRC02,
+        _PUMP1,
+        _HTR01,
+        _CHEM1,
+        _SENSE1,
+        _SCHED1,
+    )
+
+
 @pytest.fixture
-def pool_model_data() -> list[dict[str, Any]]:
+def pool_model_data(
+    pool_model_data_template: tuple[Mapping[str, Any], ...],
+) -> list[dict[str, Any]]:
     """Return test data for a complete pool model."""
     return [
-        # System object
-        {
-            "objnam": "SYS01",
-            "params": {
-                "OBJTYP": SYSTEM_TYPE,
-                "SNAME": "IntelliCenter System",
-                "PROPNAME": "Test Pool System",
-                "MODE": "ENGLISH",
-                "VER": "2.0.0",
-                "STATUS": "READY",
-            },
-        },
-        # Pool body
-        {
-            "objnam": "POOL1",
-            "params": {
-                "OBJTYP": BODY_TYPE,
-                "SUBTYP": "POOL",
-                "SNAME": "Pool",
-                "STATUS": "ON",
-                "LSTTMP": "78",
-                "LOTMP": "72",
-                "HEATER": "HTR01",
-                "HTMODE": "1",
-            },
-        },
-        # Spa body
-        {
-            "objnam": "SPA01",
-            "params": {
-                "OBJTYP": BODY_TYPE,
-                "SUBTYP": "SPA",
-                "SNAME": "Spa",
-                "STATUS": "OFF",
-                "LSTTMP": "102",
-                "LOTMP": "80",
-                "HEATER": "HTR01",
-                "HTMODE": "0",
-            },
-        },
-        # IntelliBrite light (supports color effects)
-        {
-            "objnam": "LIGHT1",
-            "params": {
-                "OBJTYP": CIRCUIT_TYPE,
-                "SUBTYP": "INTELLI",
-                "SNAME": "Pool Light",
-                "STATUS": "OFF",
-                "USE": "WHITER",
-                "FEATR": "ON",
-            },
-        },
-        # Regular light (no color effects)
-        {
-            "objnam": "LIGHT2",
-            "params": {
-                "OBJTYP": CIRCUIT_TYPE,
-                "SUBTYP": "LIGHT",
-                "SNAME": "Spa Light",
-                "STATUS": "OFF",
-                "FEATR": "ON",
-            },
-        },
-        # Light show
-        {
-            "objnam": "SHOW1",
-            "params": {
-                "OBJTYP": CIRCUIT_TYPE,
-                "SUBTYP": "LITSHO",
-                "SNAME": "Party Show",
-                "STATUS": "OFF",
-                "FEATR": "ON",
-            },
-        },
-        # Featured circuit (switch)
-        {
-            "objnam": "CIRC01",
-            "params": {
-                "OBJTYP": CIRCUIT_TYPE,
-                "SUBTYP": "GENERIC",
-                "SNAME": "Pool Cleaner",
-                "STATUS": "OFF",
-                "FEATR": "ON",
-            },
-        },
-        # Non-featured circuit (should not create switch)
-        {
-            "objnam": "CIRC02",
-            "params": {
-                "OBJTYP": CIRCUIT_TYPE,
-                "SUBTYP": "GENERIC",
-                "SNAME": "Aux Circuit",
-                "STATUS": "OFF",
-                "FEATR": "OFF",
-            },
-        },
-        # Pump
-        {
-            "objnam": "PUMP1",
-            "params": {
-                "OBJTYP": PUMP_TYPE,
-                "SUBTYP": "VS",
-                "SNAME": "Pool Pump",
-                "STATUS": "10",
-                "PWR": "1200",
-                "RPM": "2000",
-                "GPM": "55",
-            },
-        },
-        # Heater
-        {
-            "objnam": "HTR01",
-            "params": {
-                "OBJTYP": HEATER_TYPE,
-                "SUBTYP": "GAS",
-                "SNAME": "Gas Heater",
-                "STATUS": "OFF",
-                "BODY": "POOL1 SPA01",
-                "LISTORD": "1",
-            },
-        },
-        # Chemistry sensor (IntelliChem)
-        {
-            "objnam": "CHEM1",
-            "params": {
-                "OBJTYP": CHEM_TYPE,
-                "SUBTYP": "ICHEM",
-                "SNAME": "IntelliChem",
-                "PHVAL": "7.4",
-                "ORPVAL": "650",
-                "PHTNK": "5",
-                "ORPTNK": "3",
-            },
-        },
-        # Temperature sensor
-        {
-            "objnam": "SENSE1",
-            "params": {
-                "OBJTYP": SENSE_TYPE,
-                "SUBTYP": "AIR",
-                "SNAME": "Air Temp",
-                "SOURCE": "68",
-            },
-        },
-        # Schedule
-        {
-            "objnam": "SCHED1",
-            "params": {
-                "OBJTYP": SCHED_TYPE,
-                "SNAME": "Morning Filter",
-                "STATUS": "OFF",
-                "ENABLE": "ON",
-            },
-        },
+        {"objnam": obj["objnam"], "params": dict(obj["params"])}
+        for obj in pool_model_data_template
     ]
 
 
@@ -230,70 +307,67 @@ def pool_model(pool_model_data: list[dict[str, Any]]) -> PoolModel:
     return model
 
 
+# Kind -> template for the make_pool_object factory
+_POOL_OBJECT_TEMPLATES: dict[str, Mapping[str, Any]] = {
+    "light": _LIGHT1,
+    "switch": _CIRC01,
+    "pump": _PUMP1,
+    "body": _POOL1,
+}
+
+
+@pytest.fixture(scope="session")
+def make_pool_object() -> Callable[[str], PoolObject]:
+    """Return a factory building a fresh PoolObject for a template kind.
+
+    Kinds are "light", "switch", "pump" and "body". Each call copies the
+    template params, so tests may update the object in place.
+    """
+
+    def _make(kind: str) -> PoolObject:
+        template = _POOL_OBJECT_TEMPLATES[kind]
+        return PoolObject(template["objnam"], dict(template["params"]))
+
+    return _make
+
+
 @pytest.fixture
-def pool_object_light() -> PoolObject:
+def pool_object_light(make_pool_object: Callable[[str], PoolObject]) -> PoolObject:
     """Return a PoolObject representing an IntelliBrite light."""
-    return PoolObject(
-        "LIGHT1",
-        {
-            "OBJTYP": CIRCUIT_TYPE,
-            "SUBTYP": "INTELLI",
-            "SNAME": "Pool Light",
-            "STATUS": "OFF",
-            "USE": "WHITER",
-            "FEATR": "ON",
-        },
-    )
+    return make_pool_object("light")
 
 
 @pytest.fixture
-def pool_object_switch() -> PoolObject:
+def pool_object_switch(make_pool_object: Callable[[str], PoolObject]) -> PoolObject:
     """Return a PoolObject representing a featured circuit (switch)."""
-    return PoolObject(
-        "CIRC01",
-        {
-            "OBJTYP": CIRCUIT_TYPE,
-            "SUBTYP": "GENERIC",
-            "SNAME": "Pool Cleaner",
-            "STATUS": "OFF",
-            "FEATR": "ON",
-        },
-    )
+    return make_pool_object("switch")
 
 
 @pytest.fixture
-def pool_object_pump() -> PoolObject:
+def pool_object_pump(make_pool_object: Callable[[str], PoolObject]) -> PoolObject:
     """Return a PoolObject representing a variable speed pump."""
-    return PoolObject(
-        "PUMP1",
-        {
-            "OBJTYP": PUMP_TYPE,
-            "SUBTYP": "VS",
-            "SNAME": "Pool Pump",
-            "STATUS": "10",
-            "PWR": "1200",
-            "RPM": "2000",
-            "GPM": "55",
-        },
-    )
+    return make_pool_object("pump")
 
 
 @pytest.fixture
-def pool_object_body() -> PoolObject:
+def pool_object_body(make_pool_object: Callable[[str], PoolObject]) -> PoolObject:
     """Return a PoolObject representing a pool body."""
-    return PoolObject(
-        "POOL1",
-        {
-            "OBJTYP": BODY_TYPE,
-            "SUBTYP": "POOL",
-            "SNAME": "Pool",
-            "STATUS": "ON",
-            "LSTTMP": "78",
-            "LOTMP": "72",
-            "HEATER": "HTR01",
-            "HTMODE": "1",
-        },
-    )
+    return make_pool_object("body")
+
+
+def _mock_model_system_info(pool_model: PoolModel) -> MagicMock:
+    """Return a mock system info resolved once from the model's SYS01 object.
+
+    Values are plain attributes; tests can still override one with a type
+    property, which takes precedence on read.
+    """
+    sys_props = pool_model["SYS01"].properties
+    system_info = MagicMock()
+    system_info.unique_id = "test-unique-id-123"
+    system_info.prop_name = sys_props.get("PROPNAME", "Test Pool System")
+    system_info.sw_version = sys_props.get("VER", "2.0.0")
+    system_info.uses_metric = sys_props.get("MODE") == "METRIC"
+    return system_info
 
 
 @pytest.fixture
@@ -311,20 +385,7 @@ def mock_model_controller(
         mock_instance.model = pool_model
 
         # Add system info properties
-        system_obj = pool_model["SYS01"]
-        mock_instance.system_info = MagicMock()
-        type(mock_instance.system_info).unique_id = property(
-            lambda self: "test-unique-id-123"
-        )
-        type(mock_instance.system_info).prop_name = property(
-            lambda self: system_obj.properties.get("PROPNAME", "Test Pool System")
-        )
-        type(mock_instance.system_info).sw_version = property(
-            lambda self: system_obj.properties.get("VER", "2.0.0")
-        )
-        type(mock_instance.system_info).uses_metric = property(
-            lambda self: system_obj.properties.get("MODE") == "METRIC"
-        )
+        mock_instance.system_info = _mock_model_system_info(pool_model)
 
         mock_controller_class.return_value = mock_instance
         yield mock_instance
@@ -349,43 +410,28 @@ def mock_coordinator(
 
     # Configure model
     mock_coord.model = pool_model
+    # Resolve against the current model so tests can swap it out
+    mock_coord.objects_of_type.side_effect = lambda objtype, subtype=None: tuple(
+        obj
+        for obj in mock_coord.model
+        if obj.objtype == objtype and (subtype is None or obj.subtype == subtype)
+    )
 
     # Configure controller with all convenience methods
     mock_controller = MagicMock()
-    mock_controller.request_changes = AsyncMock()
-    # Convenience methods from pyintellicenter v0.1.2
-    mock_controller.set_vacation_mode = AsyncMock()
-    mock_controller.set_ph_setpoint = AsyncMock()
-    mock_controller.set_orp_setpoint = AsyncMock()
-    mock_controller.set_chlorinator_output = AsyncMock()
-    mock_controller.set_light_effect = AsyncMock()
-    mock_controller.set_setpoint = AsyncMock()
-    mock_controller.set_heat_mode = AsyncMock()
-    mock_controller.get_chlorinator_output = MagicMock(
-        return_value={"primary": 50, "secondary": 50}
-    )
-    mock_controller.is_vacation_mode = MagicMock(return_value=False)
-    # Convenience methods from pyintellicenter v0.1.3
-    mock_controller.set_alkalinity = AsyncMock()
-    mock_controller.set_calcium_hardness = AsyncMock()
-    mock_controller.set_cyanuric_acid = AsyncMock()
-    mock_controller.get_alkalinity = MagicMock(return_value=100)
-    mock_controller.get_calcium_hardness = MagicMock(return_value=300)
-    mock_controller.get_cyanuric_acid = MagicMock(return_value=40)
+    for name in _CONTROLLER_ASYNC_METHODS:
+        setattr(mock_controller, name, AsyncMock())
+    for name, value in _CONTROLLER_GETTERS:
+        setattr(mock_controller, name, MagicMock(return_value=value))
     mock_coord.controller = mock_controller
 
     # Configure system info
-    system_obj = pool_model["SYS01"]
-    mock_coord.system_info = MagicMock()
-    type(mock_coord.system_info).unique_id = property(lambda self: "test-unique-id-123")
-    type(mock_coord.system_info).prop_name = property(
-        lambda self: system_obj.properties.get("PROPNAME", "Test Pool System")
-    )
-    type(mock_coord.system_info).sw_version = property(
-        lambda self: system_obj.properties.get("VER", "2.0.0")
-    )
-    type(mock_coord.system_info).uses_metric = property(
-        lambda self: system_obj.properties.get("MODE") == "METRIC"
+    mock_coord.system_info = _mock_model_system_info(pool_model)
+    # Derived from system_info on every read so tests can flip uses_metric
+    type(mock_coord).temperature_unit = property(
+        lambda self: str(UnitOfTemperature.CELSIUS)
+        if self.system_info is not None and self.system_info.uses_metric
+        else str(UnitOfTemperature.FAHRENHEIT)
     )
 
     # Configure connection state
@@ -15,20 +15,24 @@ Requires .env file with:
 from __future__ import annotations
 
 import asyncio
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 import os
 from pathlib import Path
 import sys
+import time
+from typing import Any
 
-# Load .env file
+# Load .env file unless the environment already provides the target;
+# variables that are already set take precedence over the file
 env_path = Path(__file__).parent.parent / ".env"
-if env_path.exists():
+if "INTELLICENTER_HOST" not in os.environ and env_path.exists():
     for line in env_path.read_text().splitlines():
         line = line.strip()
         if line and not line.startswith("#") and "=" in line:
             key, value = line.split("=", 1)
-            os.environ[key.strip()] = value.strip()
+            os.environ.setdefault(key.strip(), value.strip())
 
 from pyintellicenter import (  # noqa: E402
     BODY_TYPE,
@@ -38,13 +42,15 @@ from pyintellicenter import (  # noqa: E402
     PUMP_TYPE,
     SCHED_TYPE,
     SENSE_TYPE,
+    ICBaseController,
     ICConnectionHandler,
     ICModelController,
     PoolModel,
+    PoolObject,
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IntegrationTestResult:
     """Result of a single integration test.
 
@@ -57,6 +63,30 @@ class IntegrationTestResult:
     duration_ms: float = 0
 
 
+class _TesterConnectionHandler(ICConnectionHandler):
+    """Connection handler that signals the tester on connect and on updates."""
+
+    def __init__(
+        self,
+        controller: ICModelController,
+        started: asyncio.Event,
+        updated: asyncio.Event,
+    ) -> None:
+        super().__init__(controller)
+        self._started = started
+        self._updated = updated
+
+    def on_started(self, controller: ICBaseController) -> None:
+        """Signal that the system info and model are available."""
+        self._started.set()
+
+    def on_updated(
+        self, controller: ICModelController, updates: dict[str, dict[str, Any]]
+    ) -> None:
+        """Signal that a NotifyList update arrived."""
+        self._updated.set()
+
+
 class IntegrationTester:
     """Comprehensive integration tester for IntelliCenter."""
 
@@ -67,47 +97,64 @@ class IntegrationTester:
         self.controller: ICModelController | None = None
         self.handler: ICConnectionHandler | None = None
         self.results: list[IntegrationTestResult] = []
+        self._passed_count = 0
+        self._failed_results: list[IntegrationTestResult] = []
         self.start_time: datetime | None = None
+        self._started_event = asyncio.Event()
+        self._update_event = asyncio.Event()
 
     def log(self, emoji: str, message: str) -> None:
         """Log a message with emoji prefix."""
         print(f"{emoji} {message}")
 
+    def log_indent(self, *messages: str) -> None:
+        """Log detail lines aligned under the emoji-prefixed ones, in one write."""
+        if messages:
+            print(*(f"   {message}" for message in messages), sep="\n")
+
     def add_result(
         self, name: str, passed: bool, message: str, duration_ms: float = 0
     ) -> None:
         """Add a test result."""
-        self.results.append(IntegrationTestResult(name, passed, message, duration_ms))
+        result = IntegrationTestResult(name, passed, message, duration_ms)
+        self.results.append(result)
+        if passed:
+            self._passed_count += 1
+        else:
+            self._failed_results.append(result)
         status = "✅ PASS" if passed else "❌ FAIL"
         duration = f" ({duration_ms:.0f}ms)" if duration_ms > 0 else ""
-        self.log("  ", f"{status}: {name}{duration}")
-        if not passed:
-            self.log("  ", f"       {message}")
+        if passed:
+            self.log_indent(f"{status}: {name}{duration}")
+        else:
+            self.log_indent(f"{status}: {name}{duration}", f"       {message}")
 
     async def test_connection(self) -> bool:
         """Test basic connection to IntelliCenter."""
         self.log("🔌", f"Testing connection to {self.host}:{self.port}...")
 
-        start = asyncio.get_event_loop().time()
+        start = time.perf_counter()
         try:
             self.controller = ICModelController(self.host, self.model, port=self.port)
-            self.handler = ICConnectionHandler(self.controller)
+            self.handler = _TesterConnectionHandler(
+                self.controller, self._started_event, self._update_event
+            )
 
             # Start connection with timeout
             await asyncio.wait_for(self.handler.start(), timeout=30.0)
 
-            duration = (asyncio.get_event_loop().time() - start) * 1000
+            duration = (time.perf_counter() - start) * 1000
             self.add_result("Connection", True, "Connected successfully", duration)
             return True
 
         except TimeoutError:
-            duration = (asyncio.get_event_loop().time() - start) * 1000
+            duration = (time.perf_counter() - start) * 1000
             self.add_result(
                 "Connection", False, "Connection timed out after 30s", duration
             )
             return False
         except Exception as e:
-            duration = (asyncio.get_event_loop().time() - start) * 1000
+            duration = (time.perf_counter() - start) * 1000
             self.add_result("Connection", False, f"Connection failed: {e}", duration)
             return False
 
@@ -117,11 +164,11 @@ class IntegrationTester:
 
         try:
             # Wait for system info to be populated
-            for _ in range(10):
-                info = self.controller.system_info
-                if info is not None and info.prop_name:
-                    break
-                await asyncio.sleep(0.5)
+            try:
+                await asyncio.wait_for(self._started_event.wait(), timeout=5)
+            except TimeoutError:
+                pass
+            info = self.controller.system_info
 
             if info is None:
                 self.add_result(
@@ -130,32 +177,33 @@ class IntegrationTester:
                 return False
 
             # Validate required fields
-            checks = [
-                ("Property Name", info.prop_name, bool(info.prop_name)),
-                ("Software Version", info.sw_version, bool(info.sw_version)),
-                (
-                    "Unique ID",
-                    info.unique_id,
-                    bool(info.unique_id) and len(info.unique_id) == 16,
-                ),
-                (
-                    "Uses Metric",
-                    str(info.uses_metric),
-                    info.uses_metric in (True, False),
-                ),
-            ]
+            prop_name = info.prop_name
+            prop_ok = bool(prop_name)
+            self.add_result("SystemInfo.Property Name", prop_ok, f"Value: {prop_name}")
+
+            sw_version = info.sw_version
+            sw_ok = bool(sw_version)
+            self.add_result(
+                "SystemInfo.Software Version", sw_ok, f"Value: {sw_version}"
+            )
 
-            all_passed = True
-            for name, value, passed in checks:
-                self.add_result(f"SystemInfo.{name}", passed, f"Value: {value}")
-                if not passed:
-                    all_passed = False
+            uid = info.unique_id
+            uid_ok = bool(uid) and len(uid) == 16
+            self.add_result("SystemInfo.Unique ID", uid_ok, f"Value: {uid}")
+
+            uses_metric = info.uses_metric
+            metric_ok = uses_metric in (True, False)
+            self.add_result(
+                "SystemInfo.Uses Metric", metric_ok, f"Value: {uses_metric}"
+            )
+
+            all_passed = prop_ok and sw_ok and uid_ok and metric_ok
 
             # Print summary
-            self.log("  ", f"       Pool Name: {info.prop_name}")
-            self.log("  ", f"       Version: {info.sw_version}")
-            self.log(
-                "  ", f"       Units: {'Metric' if info.uses_metric else 'Imperial'}"
+            self.log_indent(
+                f"       Pool Name: {prop_name}",
+                f"       Version: {sw_version}",
+                f"       Units: {'Metric' if uses_metric else 'Imperial'}",
             )
 
             return all_passed
@@ -181,14 +229,15 @@ class IntegrationTester:
                 return False
 
             # Count by type
-            type_counts = {}
-            for obj in self.model:
-                obj_type = obj.objtype
-                type_counts[obj_type] = type_counts.get(obj_type, 0) + 1
+            type_counts = Counter(obj.objtype for obj in self.model)
 
-            self.log("  ", "       Equipment breakdown:")
-            for obj_type, count in sorted(type_counts.items()):
-                self.log("  ", f"         - {obj_type}: {count}")
+            self.log_indent(
+                "       Equipment breakdown:",
+                *(
+                    f"         - {obj_type}: {count}"
+                    for obj_type, count in sorted(type_counts.items())
+                ),
+            )
 
             return True
 
@@ -202,48 +251,62 @@ class IntegrationTester:
 
         all_passed = True
 
+        # Partition the model by type in a single pass
+        by_type: defaultdict[str, list[PoolObject]] = defaultdict(list)
+        for obj in self.model:
+            by_type[obj.objtype].append(obj)
+
         # Test bodies (Pool/Spa)
-        bodies = self.model.get_by_type(BODY_TYPE)
+        bodies = by_type[BODY_TYPE]
         self.add_result(
             "Equipment.Bodies",
-            len(bodies) > 0,
+            bool(bodies),
             f"Found {len(bodies)} bodies (pool/spa)",
         )
-        for body in bodies:
-            self.log("  ", f"       - {body.sname} ({body.subtype}): {body.status}")
+        self.log_indent(
+            *(
+                f"       - {body.sname} ({body.subtype}): {body.status}"
+                for body in bodies
+            )
+        )
 
         # Test pumps
-        pumps = self.model.get_by_type(PUMP_TYPE)
+        pumps = by_type[PUMP_TYPE]
         self.add_result(
             "Equipment.Pumps",
             True,  # Pumps are optional
             f"Found {len(pumps)} pumps",
         )
+        pump_lines = []
         for pump in pumps:
             rpm = pump["RPM"] if "RPM" in pump.attributes else "N/A"
             pwr = pump["PWR"] if "PWR" in pump.attributes else "N/A"
-            self.log(
-                "  ",
-                f"       - {pump.sname}: Status={pump.status}, RPM={rpm}, PWR={pwr}",
+            pump_lines.append(
+                f"       - {pump.sname}: Status={pump.status}, RPM={rpm}, PWR={pwr}"
             )
+        self.log_indent(*pump_lines)
 
         # Test circuits
-        circuits = self.model.get_by_type(CIRCUIT_TYPE)
+        circuits = by_type[CIRCUIT_TYPE]
         self.add_result(
-            "Equipment.Circuits", len(circuits) > 0, f"Found {len(circuits)} circuits"
+            "Equipment.Circuits", bool(circuits), f"Found {len(circuits)} circuits"
         )
 
-        # Count lights
-        lights = [c for c in circuits if c.isALight]
-        light_shows = [c for c in circuits if c.isALightShow]
-        featured = [c for c in circuits if c.isFeatured]
-
-        self.log("  ", f"       - Lights: {len(lights)}")
-        self.log("  ", f"       - Light Shows: {len(light_shows)}")
-        self.log("  ", f"       - Featured Circuits: {len(featured)}")
+        # Count lights in a single pass over the circuits
+        num_lights = num_light_shows = num_featured = 0
+        for circuit in circuits:
+            num_lights += circuit.isALight
+            num_light_shows += circuit.isALightShow
+            num_featured += circuit.isFeatured
+
+        self.log_indent(
+            f"       - Lights: {num_lights}",
+            f"       - Light Shows: {num_light_shows}",
+            f"       - Featured Circuits: {num_featured}",
+        )
 
         # Test heaters
-        heaters = self.model.get_by_type(HEATER_TYPE)
+        heaters = by_type[HEATER_TYPE]
         self.add_result(
             "Equipment.Heaters",
             True,  # Heaters are optional
@@ -251,17 +314,18 @@ class IntegrationTester:
         )
 
         # Test sensors
-        sensors = self.model.get_by_type(SENSE_TYPE)
+        sensors = by_type[SENSE_TYPE]
         self.add_result(
             "Equipment.Sensors",
             True,  # Sensors are optional
             f"Found {len(sensors)} sensors",
         )
-        for sensor in sensors:
-            self.log("  ", f"       - {sensor.sname} ({sensor.subtype})")
+        self.log_indent(
+            *(f"       - {sensor.sname} ({sensor.subtype})" for sensor in sensors)
+        )
 
         # Test chemistry
-        chem = self.model.get_by_type(CHEM_TYPE)
+        chem = by_type[CHEM_TYPE]
         self.add_result(
             "Equipment.Chemistry",
             True,  # Chemistry is optional
@@ -269,7 +333,7 @@ class IntegrationTester:
         )
 
         # Test schedules
-        schedules = self.model.get_by_type(SCHED_TYPE)
+        schedules = by_type[SCHED_TYPE]
         self.add_result(
             "Equipment.Schedules",
             True,  # Schedules are optional
@@ -285,16 +349,17 @@ class IntegrationTester:
         try:
             # Get attribute tracking queries
             queries = self.model.attributesToTrack()
+            num_queries = len(queries)
 
-            total_attrs = sum(len(q.get("keys", [])) for q in queries)
+            total_attrs = sum(len(q.get("keys", ())) for q in queries)
 
             self.add_result(
                 "AttributeTracking.Queries",
-                len(queries) > 0,
-                f"Tracking {total_attrs} attributes across {len(queries)} objects",
+                num_queries > 0,
+                f"Tracking {total_attrs} attributes across {num_queries} objects",
             )
 
-            return len(queries) > 0
+            return num_queries > 0
 
         except Exception as e:
             self.add_result("AttributeTracking", False, f"Failed: {e}")
@@ -326,9 +391,11 @@ class IntegrationTester:
                 f"Avg response time: {avg_time_ms:.1f}ms",
             )
 
-            self.log("  ", f"       Reconnect attempts: {metrics.reconnect_attempts}")
-            self.log("  ", f"       Successful connects: {metrics.successful_connects}")
-            self.log("  ", f"       Requests failed: {metrics.requests_failed}")
+            self.log_indent(
+                f"       Reconnect attempts: {metrics.reconnect_attempts}",
+                f"       Successful connects: {metrics.successful_connects}",
+                f"       Requests failed: {metrics.requests_failed}",
+            )
 
             return True
 
@@ -338,14 +405,18 @@ class IntegrationTester:
 
     async def test_real_time_updates(self) -> bool:
         """Test that real-time updates are working."""
-        self.log("⚡", "Testing real-time updates (waiting 5s for NotifyList)...")
+        self.log("⚡", "Testing real-time updates (up to 5s for NotifyList)...")
 
         try:
             # Record initial state
             initial_completed = self.controller.metrics.requests_completed
 
-            # Wait for potential updates
-            await asyncio.sleep(5)
+            # Wait for the first update, giving up after 5s
+            self._update_event.clear()
+            try:
+                await asyncio.wait_for(self._update_event.wait(), timeout=5)
+            except TimeoutError:
+                pass
 
             final_completed = self.controller.metrics.requests_completed
             updates_received = final_completed - initial_completed
@@ -354,7 +425,7 @@ class IntegrationTester:
             self.add_result(
                 "RealTimeUpdates",
                 True,
-                f"Received {updates_received} responses during 5s window",
+                f"Received {updates_received} responses while waiting for NotifyList",
             )
 
             return True
@@ -391,9 +462,9 @@ class IntegrationTester:
 
     def print_summary(self) -> None:
         """Print test summary."""
-        total = len(self.results)
-        passed = sum(1 for r in self.results if r.passed)
-        failed = total - passed
+        passed = self._passed_count
+        failed = len(self._failed_results)
+        total = passed + failed
 
         print("\n" + "=" * 60)
         print("📊 INTEGRATION TEST SUMMARY")
@@ -407,9 +478,8 @@ class IntegrationTester:
 
         if failed > 0:
             print("\n❌ Failed Tests:")
-            for r in self.results:
-                if not r.passed:
-                    print(f"   - {r.name}: {r.message}")
+            for r in self._failed_results:
+                print(f"   - {r.name}: {r.message}")
 
         print()
 
@@ -445,7 +515,7 @@ class IntegrationTester:
 
         self.print_summary()
 
-        return all(r.passed for r in self.results)
+        return not self._failed_results
 
 
 async def main() -> int:
@@ -1,11 +1,13 @@
 """Test the Pentair IntelliCenter integration initialization."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST
+from homeassistant.const import CONF_HOST, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from pyintellicenter import BODY_TYPE, MODE_ATTR, SYSTEM_TYPE, VACFLO_ATTR
 import pytest
 
 from custom_components.intellicenter import (
@@ -245,6 +247,98 @@ class TestIntelliCenterCoordinator:
         model = coordinator.model
         assert model is not None
 
+    async def test_coordinator_objects_of_type(
+        self, hass: HomeAssistant, pool_model_data: list[dict[str, Any]]
+    ) -> None:
+        """Test coordinator indexes model objects by type and subtype."""
+        entry = MagicMock(spec=ConfigEntry)
+        entry.entry_id = "test_entry_123"
+        entry.data = {CONF_HOST: "192.168.1.100"}
+
+        coordinator = IntelliCenterCoordinator(
+            hass,
+            entry,
+            host="192.168.1.100",
+        )
+        coordinator.model.add_objects(pool_model_data)
+
+        bodies = coordinator.objects_of_type(BODY_TYPE)
+        assert {obj.objnam for obj in bodies} == {"POOL1", "SPA01"}
+
+        spas = coordinator.objects_of_type(BODY_TYPE, "SPA")
+        assert [obj.objnam for obj in spas] == ["SPA01"]
+
+        assert coordinator.objects_of_type("UNKNOWN") == ()
+
+    async def test_coordinator_temperature_unit(self, hass: HomeAssistant) -> None:
+        """Test coordinator caches the temperature unit until MODE changes."""
+        entry = MagicMock(spec=ConfigEntry)
+        entry.entry_id = "test_entry_123"
+        entry.data = {CONF_HOST: "192.168.1.100"}
+
+        coordinator = IntelliCenterCoordinator(
+            hass,
+            entry,
+            host="192.168.1.100",
+        )
+        coordinator.model.add_objects(
+            [{"objnam": "SYS01", "params": {"OBJTYP": SYSTEM_TYPE, "MODE": "METRIC"}}]
+        )
+
+        system_info = MagicMock()
+        system_info.uses_metric = True
+        with patch.object(
+            IntelliCenterCoordinator,
+            "system_info",
+            new_callable=PropertyMock,
+            return_value=system_info,
+        ):
+            assert coordinator.temperature_unit == UnitOfTemperature.CELSIUS
+
+            # Cached until the system reports a MODE change
+            system_info.uses_metric = False
+            coordinator.async_set_updated_data({"SYS01": {VACFLO_ATTR: "ON"}})
+            assert coordinator.temperature_unit == UnitOfTemperature.CELSIUS
+
+            coordinator.async_set_updated_data({"SYS01": {MODE_ATTR: "ENGLISH"}})
+            assert coordinator.temperature_unit == UnitOfTemperature.FAHRENHEIT
+
+    async def test_coordinator_object_listeners(self, hass: HomeAssistant) -> None:
+        """Test push updates only reach listeners for the updated objects."""
+        entry = MagicMock(spec=ConfigEntry)
+        entry.entry_id = "test_entry_123"
+        entry.data = {CONF_HOST: "192.168.1.100"}
+
+        coordinator = IntelliCenterCoordinator(
+            hass,
+            entry,
+            host="192.168.1.100",
+        )
+
+        pool_listener = MagicMock()
+        heater_listener = MagicMock()
+        coordinator.async_add_object_listener(["POOL1"], pool_listener)
+        remove_heater = coordinator.async_add_object_listener(
+            ["HTR01", "POOL1", "SPA01"], heater_listener
+        )
+
+        coordinator.async_set_updated_data({"SPA01": {"STATUS": "ON"}})
+        pool_listener.assert_not_called()
+        heater_listener.assert_called_once()
+
+        # A listener registered for several updated objects runs once
+        heater_listener.reset_mock()
+        coordinator.async_set_updated_data(
+            {"POOL1": {"STATUS": "ON"}, "SPA01": {"STATUS": "OFF"}}
+        )
+        pool_listener.assert_called_once()
+        heater_listener.assert_called_once()
+
+        heater_listener.reset_mock()
+        remove_heater()
+        coordinator.async_set_updated_data({"SPA01": {"STATUS": "ON"}})
+        heater_listener.assert_not_called()
+
     async def test_coordinator_system_info_property(self, hass: HomeAssistant) -> None:
         """Test coordinator system_info property."""
         entry = MagicMock(spec=ConfigEntry)
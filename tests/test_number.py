@@ -219,8 +219,9 @@ async def test_number_set_value_secondary(
     mock_coordinator.controller.set_chlorinator_output.assert_called_once_with(
         "ICHLOR1",
         50,
-        40,  # 50 is the mocked current primary value
+        40,  # 50 is the current PRIM value on the pool object
     )
+    mock_coordinator.controller.get_chlorinator_output.assert_not_called()
 
 
 async def test_number_set_value_converts_to_int(
@@ -244,6 +245,36 @@ async def test_number_set_value_converts_to_int(
     )
 
 
+@pytest.mark.parametrize(
+    "attribute_key,value",
+    [
+        (PRIM_ATTR, float("nan")),
+        (PRIM_ATTR, float("inf")),
+        (SEC_ATTR, float("nan")),
+    ],
+)
+async def test_number_set_value_non_finite(
+    hass: HomeAssistant,
+    pool_object_intellichlor: PoolObject,
+    mock_coordinator: MagicMock,
+    caplog: pytest.LogCaptureFixture,
+    attribute_key: str,
+    value: float,
+) -> None:
+    """Test a non-finite value is logged instead of failing the service call."""
+    number = PoolNumber(
+        mock_coordinator,
+        pool_object_intellichlor,
+        attribute_key=attribute_key,
+    )
+    number.hass = hass  # Required for async_create_task
+
+    await number.async_set_native_value(value)
+
+    mock_coordinator.controller.set_chlorinator_output.assert_not_called()
+    assert "Invalid setpoint value for ICHLOR1" in caplog.text
+
+
 async def test_number_unique_id(
     hass: HomeAssistant,
     pool_object_intellichlor: PoolObject,
@@ -183,6 +183,30 @@ async def test_temperature_sensor_metric(
     assert sensor.native_unit_of_measurement == str(UnitOfTemperature.CELSIUS)
 
 
+async def test_temperature_sensor_unit_follows_system_setting(
+    hass: HomeAssistant,
+    pool_object_temp_sensor: PoolObject,
+    mock_coordinator: MagicMock,
+    mock_write_ha_state: MagicMock,
+) -> None:
+    """Test temperature sensor refreshes its unit on coordinator updates."""
+    sensor = PoolSensor(
+        mock_coordinator,
+        pool_object_temp_sensor,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        attribute_key=SOURCE_ATTR,
+    )
+    assert sensor.native_unit_of_measurement == str(UnitOfTemperature.FAHRENHEIT)
+
+    # System switched to metric; a connection state update is broadcast
+    type(mock_coordinator.system_info).uses_metric = property(lambda self: True)
+    mock_coordinator.data = {}
+    sensor._handle_coordinator_update()
+
+    assert sensor.native_unit_of_measurement == str(UnitOfTemperature.CELSIUS)
+    mock_write_ha_state.assert_called_once()
+
+
 async def test_pump_power_sensor(
     hass: HomeAssistant,
     pool_object_pump: PoolObject,
@@ -231,6 +255,37 @@ async def test_pump_power_sensor_rounding(
     assert sensor.native_value == 1225
 
 
+async def test_pump_power_sensor_skips_unchanged_rounded_value(
+    hass: HomeAssistant,
+    mock_coordinator: MagicMock,
+    mock_write_ha_state: MagicMock,
+) -> None:
+    """Test no state is written when the rounded value does not change."""
+    pump = mock_coordinator.model["PUMP1"]
+    sensor = PoolSensor(
+        mock_coordinator,
+        pump,
+        device_class=SensorDeviceClass.POWER,
+        unit_of_measurement=UnitOfPower.WATT,
+        attribute_key=PWR_ATTR,
+        rounding_factor=25,
+    )
+    assert sensor.native_value == 1200
+
+    # 1205 still rounds to 1200
+    pump.update({PWR_ATTR: "1205"})
+    mock_coordinator.data = {"PUMP1": {PWR_ATTR: "1205"}}
+    sensor._handle_coordinator_update()
+    mock_write_ha_state.assert_not_called()
+
+    # 1240 rounds to 1250
+    pump.update({PWR_ATTR: "1240"})
+    mock_coordinator.data = {"PUMP1": {PWR_ATTR: "1240"}}
+    sensor._handle_coordinator_update()
+    mock_write_ha_state.assert_called_once()
+    assert sensor.native_value == 1250
+
+
 async def test_pump_rpm_sensor(
     hass: HomeAssistant,
     pool_object_pump: PoolObject,
@@ -450,6 +505,31 @@ async def test_sensor_state_updates(
     assert sensor.native_value == 72
 
 
+async def test_sensor_native_value_cached_until_updated(
+    hass: HomeAssistant,
+    pool_object_temp_sensor: PoolObject,
+    mock_coordinator: MagicMock,
+) -> None:
+    """Test sensor reuses its converted value until its attribute is updated."""
+    sensor = PoolSensor(
+        mock_coordinator,
+        pool_object_temp_sensor,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        attribute_key=SOURCE_ATTR,
+    )
+
+    assert sensor.native_value == 68
+
+    # An unrelated update does not invalidate the cached value
+    pool_object_temp_sensor.update({SOURCE_ATTR: "72"})
+    assert sensor.isUpdated({"SENSE1": {"OTHER": "value"}}) is False
+    assert sensor.native_value == 68
+
+    # An update to the sensor's attribute does
+    assert sensor.isUpdated({"SENSE1": {SOURCE_ATTR: "72"}}) is True
+    assert sensor.native_value == 72
+
+
 async def test_sensor_unique_id_with_attribute(
     hass: HomeAssistant,
     pool_object_pump: PoolObject,
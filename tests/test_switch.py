@@ -11,7 +11,7 @@ from pyintellicenter import (
 )
 import pytest
 
-from custom_components.intellicenter.switch import PoolBody, PoolCircuit
+from custom_components.intellicenter.switch import PoolBody, PoolCircuit, PoolVacation
 
 pytestmark = pytest.mark.asyncio
 
@@ -194,6 +194,27 @@ async def test_vacation_mode_switch(
     assert vacation_switch.entity_registry_enabled_default is False
 
 
+async def test_vacation_switch_skips_write_when_state_unchanged(
+    hass: HomeAssistant,
+    pool_model: PoolModel,
+    mock_coordinator: MagicMock,
+    mock_write_ha_state: MagicMock,
+) -> None:
+    """Test vacation mode only writes an optimistic state when it changes."""
+    vacation_switch = PoolVacation(mock_coordinator, pool_model["SYS01"])
+    mock_coordinator.controller.is_vacation_mode.return_value = True
+
+    await vacation_switch.async_turn_on()
+
+    mock_write_ha_state.assert_not_called()
+    mock_coordinator.controller.set_vacation_mode.assert_awaited_once_with(True)
+
+    await vacation_switch.async_turn_off()
+
+    mock_write_ha_state.assert_called_once()
+    assert vacation_switch.is_on is False
+
+
 async def test_switch_state_updates(
     hass: HomeAssistant,
     pool_object_switch: PoolObject,
@@ -21,12 +21,14 @@ from pyintellicenter import (
     LOTMP_ATTR,
     LSTTMP_ATTR,
     NULL_OBJNAM,
+    SNAME_ATTR,
     STATUS_ATTR,
     PoolModel,
     PoolObject,
 )
 import pytest
 
+from custom_components.intellicenter.coordinator import IntelliCenterCoordinator
 from custom_components.intellicenter.water_heater import PoolWaterHeater
 
 pytestmark = pytest.mark.asyncio
@@ -284,6 +286,23 @@ async def test_water_heater_set_temperature(
     mock_coordinator.controller.set_setpoint.assert_called_once_with("POOL1", 80)
 
 
+async def test_water_heater_set_temperature_unchanged(
+    hass: HomeAssistant,
+    pool_object_body_with_heater: PoolObject,
+    mock_coordinator: MagicMock,
+) -> None:
+    """Test setting the current target temperature sends nothing."""
+    water_heater = PoolWaterHeater(
+        mock_coordinator,
+        pool_object_body_with_heater,
+        ["HTR01"],
+    )
+
+    await water_heater.async_set_temperature(**{ATTR_TEMPERATURE: 72})
+
+    mock_coordinator.controller.set_setpoint.assert_not_called()
+
+
 async def test_water_heater_set_temperature_invalid(
     hass: HomeAssistant,
     pool_object_body_with_heater: PoolObject,
@@ -466,6 +485,31 @@ async def test_water_heater_operation_list(
     assert "Solar Heater" in operations
 
 
+async def test_water_heater_operation_list_follows_heater_rename(
+    hass: HomeAssistant,
+    pool_object_body_with_heater: PoolObject,
+    pool_object_heater: PoolObject,
+    mock_coordinator: MagicMock,
+) -> None:
+    """Test operation modes are rebuilt only when a heater is renamed."""
+
+    mock_coordinator.model = MagicMock()
+    mock_coordinator.model.__getitem__ = MagicMock(return_value=pool_object_heater)
+
+    water_heater = PoolWaterHeater(
+        mock_coordinator,
+        pool_object_body_with_heater,
+        ["HTR01"],
+    )
+    assert water_heater.operation_list == [STATE_OFF, "Gas Heater"]
+    assert water_heater.current_operation == "Gas Heater"
+
+    pool_object_heater.update({SNAME_ATTR: "Heat Pump"})
+    assert water_heater.isUpdated({"HTR01": {SNAME_ATTR: "Heat Pump"}}) is True
+    assert water_heater.operation_list == [STATE_OFF, "Heat Pump"]
+    assert water_heater.current_operation == "Heat Pump"
+
+
 async def test_water_heater_set_operation_mode(
     hass: HomeAssistant,
     pool_object_body_with_heater: PoolObject,
@@ -489,6 +533,11 @@ async def test_water_heater_set_operation_mode(
     )
     water_heater.hass = hass  # Required for async_create_task
 
+    # Already heating with the requested heater: nothing to send
+    await water_heater.async_set_operation_mode("Gas Heater")
+    mock_coordinator.controller.request_changes.assert_not_called()
+
+    pool_object_body_with_heater.update({HEATER_ATTR: NULL_OBJNAM})
     await water_heater.async_set_operation_mode("Gas Heater")
 
     mock_coordinator.controller.request_changes.assert_called_once()
@@ -652,3 +701,98 @@ async def test_water_heater_extra_state_attributes(
     assert attrs["OBJNAM"] == "POOL1"
     assert "LAST_HEATER" in attrs  # Should include last heater
     assert attrs["LAST_HEATER"] == "HTR01"
+
+
+async def test_water_heater_extra_state_attributes_cached_until_updated(
+    hass: HomeAssistant,
+    pool_object_body_with_heater: PoolObject,
+    mock_coordinator: MagicMock,
+) -> None:
+    """Test extra state attributes are rebuilt only after a tracked update."""
+
+    water_heater = PoolWaterHeater(
+        mock_coordinator,
+        pool_object_body_with_heater,
+        ["HTR01"],
+    )
+
+    attrs = water_heater.extra_state_attributes
+    assert water_heater.extra_state_attributes is attrs
+
+    # Unrelated attributes keep the cached dict
+    assert water_heater.isUpdated({"POOL1": {"UNRELATED": "value"}}) is False
+    assert water_heater.extra_state_attributes is attrs
+
+    pool_object_body_with_heater.update({HTMODE_ATTR: "0"})
+    assert water_heater.isUpdated({"POOL1": {HTMODE_ATTR: "0"}}) is True
+    assert water_heater.extra_state_attributes[HTMODE_ATTR] == "0"
+
+
+async def test_water_heater_state_cached_until_updated(
+    hass: HomeAssistant,
+    pool_object_body_with_heater: PoolObject,
+    mock_coordinator: MagicMock,
+) -> None:
+    """Test the state is recomputed only after a tracked update."""
+
+    water_heater = PoolWaterHeater(
+        mock_coordinator,
+        pool_object_body_with_heater,
+        ["HTR01"],
+    )
+    assert water_heater.state == STATE_ON
+
+    pool_object_body_with_heater.update({HTMODE_ATTR: "0"})
+    assert water_heater.state == STATE_ON
+
+    assert water_heater.isUpdated({"POOL1": {HTMODE_ATTR: "0"}}) is True
+    assert water_heater.state == STATE_IDLE
+
+
+async def test_water_heater_listens_to_body_and_heaters(
+    hass: HomeAssistant,
+    mock_config_entry: MagicMock,
+    mock_write_ha_state: MagicMock,
+) -> None:
+    """Test the coordinator delivers heater updates and skips unrelated ones."""
+    coordinator = IntelliCenterCoordinator(
+        hass, mock_config_entry, host="192.168.1.100"
+    )
+    coordinator.model.add_objects(
+        [
+            {
+                "objnam": "POOL1",
+                "params": {
+                    "OBJTYP": BODY_TYPE,
+                    "SUBTYP": "POOL",
+                    "SNAME": "Pool",
+                    "STATUS": "ON",
+                    "HEATER": "HTR01",
+                    "HTMODE": "1",
+                },
+            },
+            {
+                "objnam": "HTR01",
+                "params": {
+                    "OBJTYP": HEATER_TYPE,
+                    "SUBTYP": "GAS",
+                    "SNAME": "Gas Heater",
+                    "BODY": "POOL1",
+                },
+            },
+        ]
+    )
+
+    water_heater = PoolWaterHeater(coordinator, coordinator.model["POOL1"], ["HTR01"])
+    water_heater.hass = hass
+    await water_heater.async_added_to_hass()
+    assert water_heater.operation_list == [STATE_OFF, "Gas Heater"]
+
+    # An update for an object the entity does not use never reaches it
+    coordinator.async_set_updated_data({"CIRC01": {STATUS_ATTR: "ON"}})
+    mock_write_ha_state.assert_not_called()
+
+    coordinator.model["HTR01"].update({SNAME_ATTR: "Heat Pump"})
+    coordinator.async_set_updated_data({"HTR01": {SNAME_ATTR: "Heat Pump"}})
+    mock_write_ha_state.assert_called_once()
+    assert water_heater.operation_list == [STATE_OFF, "Heat Pump"]